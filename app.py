@@ -2,6 +2,8 @@
 Main Streamlit application for the Universal Web Scraper.
 """
 
+import copy
+import json
 import time
 import os
 from typing import Union, List
@@ -10,9 +12,19 @@ import streamlit as st
 
 from src.config import Config, ScrapingMode
 from src.models import ScrapedPage
-from src.scrapers import BasicScraper, PeptiPricesScraper, PepPediaBulkScraper
+from src.scrapers import BasicScraper, PeptiPricesScraper, PepPediaBulkScraper, create_session
 from src.ui import UIComponents, DataDisplay, DownloadManager
-from src.utils import create_progress_callback, ContentCategorizer
+from src.utils import create_progress_callback, ContentCategorizer, TTLCache
+
+
+@st.cache_resource
+def _scrape_cache() -> TTLCache:
+    """Scrape results shared across reruns, keyed on (mode, url, options).
+    
+    A plain cache rather than ``st.cache_data``: bulk scrapes draw a progress
+    bar, and Streamlit would replay those elements on every cache hit.
+    """
+    return TTLCache(Config.SCRAPE_CACHE_TTL_SECONDS, Config.SCRAPE_CACHE_MAX_ENTRIES)
 
 
 class WebScraperApp:
@@ -21,11 +33,22 @@ class WebScraperApp:
     def __init__(self):
         self.download_manager = DownloadManager()
         
+        # One connection pool for every scraper, so repeat hosts reuse open sockets
+        self.session = create_session()
+        
         self.scrapers = {
-            ScrapingMode.BASIC: BasicScraper(),
-            ScrapingMode.CUSTOM_SELECTORS: BasicScraper(),
-            'PeptiPrices': PeptiPricesScraper(),
-            'Pep-Pedia': PepPediaBulkScraper()  # Will be updated with API key from UI
+            ScrapingMode.BASIC: BasicScraper(session=self.session),
+            ScrapingMode.CUSTOM_SELECTORS: BasicScraper(session=self.session),
+            ScrapingMode.PEPTI_PRICES: PeptiPricesScraper(session=self.session),
+            ScrapingMode.PEP_PEDIA: PepPediaBulkScraper(session=self.session)  # Will be updated with API key from UI
+        }
+        
+        # Mode -> handler table, built once so each request is a single lookup
+        self._dispatch = {
+            ScrapingMode.BASIC: self._scrape_basic,
+            ScrapingMode.CUSTOM_SELECTORS: self._scrape_custom_selectors,
+            ScrapingMode.PEPTI_PRICES: self._scrape_pepti_prices,
+            ScrapingMode.PEP_PEDIA: self._scrape_pep_pedia
         }
     
     def run(self):
@@ -44,6 +67,8 @@ class WebScraperApp:
     
     def _handle_scraping_request(self, mode: str, url: str, config: dict):
         """Handle scraping request based on mode."""
+        # Strip once so validation, the scrapers and the scrape cache key all see the same URL
+        url = url.strip()
         if not UIComponents.validate_url(url):
             return
         
@@ -53,9 +78,11 @@ class WebScraperApp:
                 data = self._scrape_data(mode, url, config)
                 
                 if data:
+                    # Format downloads in the background while the results render
+                    prepared_downloads = self.download_manager.prepare_downloads(data)
                     DataDisplay.display_success("Scraping completed successfully!")
                     DataDisplay.display_scraped_data(data)
-                    self.download_manager.render_download_section(data)
+                    self.download_manager.render_download_section(data, prepared_downloads)
                     DataDisplay.display_raw_data_preview(data)
                 else:
                     DataDisplay.display_error("Failed to scrape the URL. Please check if the URL is accessible and try again.")
@@ -65,54 +92,67 @@ class WebScraperApp:
     
     def _scrape_data(self, mode: str, url: str, config: dict) -> Union[ScrapedPage, List[ScrapedPage]]:
         """Scrape data based on selected mode."""
-        # Handle specialized scrapers (case-insensitive matching)
-        mode_lower = mode.lower()
-        if 'peptiprices' in mode_lower:
-            scraper = self.scrapers['PeptiPrices']
-            # Create progress components for bulk scraping
-            progress_bar, status_text = DataDisplay.create_progress_components()
-            progress_callback = create_progress_callback(progress_bar, status_text)
-            
-            try:
-                data = scraper.scrape(url, bulk_scrape=True, progress_callback=progress_callback)
-                return data
-            except Exception as e:
-                progress_bar.empty()
-                status_text.empty()
-                raise e
+        if mode not in self._dispatch:
+            raise ValueError(f"Unknown scraping mode: {mode}")
         
-        elif 'pep-pedia' in mode_lower:
-            scraper = self.scrapers['Pep-Pedia']
-            # Update scraper with API key from config if provided
-            openai_api_key = config.get('openai_api_key')
-            if openai_api_key:
-                scraper.categorizer = ContentCategorizer(openai_api_key)
-            
-            # Create progress components for bulk scraping
-            progress_bar, status_text = DataDisplay.create_progress_components()
-            progress_callback = create_progress_callback(progress_bar, status_text)
-            
-            try:
-                data = scraper.scrape(url, bulk_scrape=True, progress_callback=progress_callback)
-                return data
-            except Exception as e:
-                progress_bar.empty()
-                status_text.empty()
-                raise e
+        # A new API key changes who categorizes, not what is scraped, so only
+        # whether one is set goes into the key
+        options = {key: value for key, value in config.items() if key != 'openai_api_key'}
+        options['use_ai'] = bool(config.get('openai_api_key'))
+        cache_key = (mode, url, json.dumps(options, sort_keys=True, default=str))
         
-        # Handle standard modes - check if mode exists in scrapers dict
-        if mode in self.scrapers:
-            scraper = self.scrapers[mode]
-            
-            if mode == ScrapingMode.BASIC:
-                return scraper.scrape(url)
-            
-            elif mode == ScrapingMode.CUSTOM_SELECTORS:
-                selectors = config.get('selectors', {})
-                return scraper.scrape(url, selectors=selectors)
+        cache = _scrape_cache()
+        data = cache.get(cache_key)
+        if data is not None:
+            # Hand out a copy so nothing downstream mutates the shared result
+            return copy.deepcopy(data)
         
-        # If we get here, the mode is not recognized
-        raise ValueError(f"Unknown scraping mode: {mode}")
+        data = self._dispatch[mode](url, config)
+        # Failed or empty scrapes are not stored, so a retry goes back to the network
+        if data:
+            cache.set(cache_key, data)
+        return data
+    
+    def _scrape_basic(self, url: str, config: dict) -> ScrapedPage:
+        """Scrape a single page for basic content."""
+        return self.scrapers[ScrapingMode.BASIC].scrape(url)
+    
+    def _scrape_custom_selectors(self, url: str, config: dict) -> ScrapedPage:
+        """Scrape a single page using custom CSS selectors."""
+        selectors = config.get('selectors', {})
+        return self.scrapers[ScrapingMode.CUSTOM_SELECTORS].scrape(url, selectors=selectors)
+    
+    def _scrape_pepti_prices(self, url: str, config: dict) -> List[ScrapedPage]:
+        """Bulk scrape PeptiPrices."""
+        return self._run_bulk_scrape(self.scrapers[ScrapingMode.PEPTI_PRICES], url)
+    
+    def _scrape_pep_pedia(self, url: str, config: dict) -> List[ScrapedPage]:
+        """Bulk scrape Pep-Pedia."""
+        scraper = self.scrapers[ScrapingMode.PEP_PEDIA]
+        # Update scraper with API key from config if provided
+        openai_api_key = config.get('openai_api_key')
+        if openai_api_key:
+            scraper.categorizer = ContentCategorizer(openai_api_key)
+        
+        return self._run_bulk_scrape(scraper, url)
+    
+    def _run_bulk_scrape(self, scraper, url: str) -> List[ScrapedPage]:
+        """Run a specialized bulk scrape with progress reporting."""
+        # Create progress components for bulk scraping
+        progress_bar, status_text = DataDisplay.create_progress_components()
+        progress_callback = create_progress_callback(progress_bar, status_text)
+        
+        try:
+            return scraper.scrape(url, bulk_scrape=True, progress_callback=progress_callback)
+        except Exception as e:
+            progress_bar.empty()
+            status_text.empty()
+            raise e
+    
+    def __del__(self):
+        """Close the shared session when the app is destroyed."""
+        if hasattr(self, 'session'):
+            self.session.close()
 
 
 def main():
@@ -5,9 +5,7 @@ Standalone script to convert raw Pep-Pedia CSV to AI-enhanced CSV.
 
 import sys
 import os
-import pandas as pd
-from datetime import datetime
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+import time
 
 from src.processors.pep_pedia_ai_processor import PepPediaAIProcessor
 
@@ -34,7 +32,7 @@ def convert_raw_to_enhanced(input_csv_path: str, output_csv_path: str = None) ->
     
     # Generate output filename if not provided
     if not output_csv_path:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         output_csv_path = f"pep_pedia_enhanced_{timestamp}.csv"
     
     # Process the CSV
@@ -62,11 +60,11 @@ def convert_raw_to_enhanced(input_csv_path: str, output_csv_path: str = None) ->
 def main():
     """Main function."""
     if len(sys.argv) < 2:
-        print("Usage: python convert_raw_to_enhanced.py <input_csv> [output_csv]")
+        print("Usage: python -m scripts.convert_raw_to_enhanced <input_csv> [output_csv]")
         print()
         print("Examples:")
-        print("  python convert_raw_to_enhanced.py peptide_raw_20260108_030222.csv")
-        print("  python convert_raw_to_enhanced.py peptide_raw_20260108_030222.csv enhanced_output.csv")
+        print("  python -m scripts.convert_raw_to_enhanced peptide_raw_20260108_030222.csv")
+        print("  python -m scripts.convert_raw_to_enhanced peptide_raw_20260108_030222.csv enhanced_output.csv")
         print()
         print("Note: Make sure OPENAI_API_KEY is set in environment")
         return
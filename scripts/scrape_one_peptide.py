@@ -6,12 +6,12 @@ Simple test script to scrape one peptide URL and output CSV.
 import sys
 import os
 import json
-from datetime import datetime
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+import time
 
 from src.scrapers.pep_pedia_bulk import PepPediaBulkScraper
 from src.formatters.csv_formatter import CSVFormatter
 from src.processors.pep_pedia_ai_processor import PepPediaAIProcessor
+from src.utils import write_output_file
 
 def scrape_one_peptide(url: str, use_ai: bool = True):
     """Scrape one peptide and generate CSV output."""
@@ -45,27 +45,25 @@ def scrape_one_peptide(url: str, use_ai: bool = True):
     except Exception as e:
         print(f"❌ Scraping error: {e}")
         return None
+    finally:
+        scraper.close()
     
     # Step 2: Generate raw CSV
     print("\n📊 Step 2: Generating raw CSV...")
     formatter = CSVFormatter()
     
     try:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         raw_csv_filename = f"peptide_raw_{timestamp}.csv"
         
-        csv_content = formatter._format_pep_pedia_csv_multiple([page_data])
+        csv_content = formatter.format([page_data])
         
-        with open(raw_csv_filename, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
+        write_output_file(raw_csv_filename, csv_content)
         
         print(f"✅ Raw CSV saved: {raw_csv_filename}")
         
-        # Show preview
-        with open(raw_csv_filename, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            total_length = sum(len(line) for line in lines)
-            print(f"📄 CSV size: {total_length:,} characters")
+        # Show preview from the content already in memory
+        print(f"📄 CSV size: {len(csv_content):,} characters")
             
     except Exception as e:
         print(f"❌ CSV generation error: {e}")
@@ -100,13 +98,19 @@ def scrape_one_peptide(url: str, use_ai: bool = True):
     
     # Show preview of final CSV
     try:
-        with open(final_csv, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            print(f"📊 Total rows: {len(lines)}")
-            print(f"📋 Preview:")
-            print("-" * 50)
-            print(lines[0][:200] + "..." if lines else "No content")
-            print("-" * 50)
+        if final_csv == raw_csv_filename:
+            total_lines = csv_content.count('\n')
+            header = csv_content.partition('\n')[0]
+        else:
+            # Stream the file: keep the header line and count the rest
+            with open(final_csv, 'r', encoding='utf-8') as f:
+                header = next(f, '')
+                total_lines = (1 if header else 0) + sum(1 for _ in f)
+        print(f"📊 Total rows: {total_lines}")
+        print(f"📋 Preview:")
+        print("-" * 50)
+        print(header[:200] + "..." if header else "No content")
+        print("-" * 50)
     except Exception as e:
         print(f"⚠️  Could not preview CSV: {e}")
     
@@ -115,9 +119,9 @@ def scrape_one_peptide(url: str, use_ai: bool = True):
 def main():
     """Main function."""
     if len(sys.argv) < 2:
-        print("Usage: python scrape_one_peptide.py <URL> [--no-ai]")
-        print("Example: python scrape_one_peptide.py https://pep-pedia.org/peptides/bpc-157")
-        print("Example: python scrape_one_peptide.py https://pep-pedia.org/peptides/bpc-157 --no-ai")
+        print("Usage: python -m scripts.scrape_one_peptide <URL> [--no-ai]")
+        print("Example: python -m scripts.scrape_one_peptide https://pep-pedia.org/peptides/bpc-157")
+        print("Example: python -m scripts.scrape_one_peptide https://pep-pedia.org/peptides/bpc-157 --no-ai")
         return
     
     url = sys.argv[1]
@@ -2,7 +2,8 @@
 Configuration settings for the web scraper.
 """
 
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Pattern, Tuple
 import re
 
 class Config:
@@ -12,6 +13,44 @@ class Config:
     DEFAULT_DELAY = 1
     TIMEOUT = 10
     MAX_RETRIES = 3
+    RETRY_BACKOFF_FACTOR = 0.3
+    RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+    POOL_CONNECTIONS = 64
+    DEFAULT_CONCURRENCY = 8
+    PARSE_IN_PROCESSES = True
+    # Smaller batches parse on threads; spawning workers would cost more than it saves
+    PARSE_PROCESS_MIN_PAGES = 16
+    
+    # Simultaneous crawler requests to any one host, each followed by DEFAULT_DELAY
+    PER_HOST_CONCURRENCY = 2
+    
+    # Concurrent OpenAI categorization requests when enhancing CSVs
+    AI_CONCURRENCY = 10
+    
+    # Background formatting of download files in the Streamlit app
+    DOWNLOAD_FORMAT_WORKERS = 2
+    DOWNLOAD_POLL_SECONDS = 0.5
+    
+    # On-disk HTTP cache
+    HTTP_CACHE_ENABLED = True
+    HTTP_CACHE_NAME = 'scrape_cache'
+    HTTP_CACHE_EXPIRE_SECONDS = 3600
+    
+    # In-app cache of scrape results across Streamlit reruns
+    SCRAPE_CACHE_TTL_SECONDS = 3600
+    SCRAPE_CACHE_MAX_ENTRIES = 128
+    
+    # Response size guard (bytes)
+    MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+    # The sitemap protocol allows up to 50MB uncompressed per file
+    SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
+    # HTML parser backend handed to BeautifulSoup (C-based lxml by default)
+    HTML_PARSER = 'lxml'
+    
+    # Tags dropped from the tree before title/content extraction
+    BOILERPLATE_TAGS = ['script', 'style', 'noscript', 'svg', 'iframe', 'template']
     
     # Default User Agent
     USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -22,6 +61,8 @@ class Config:
         r'#',
         r'\?'
     ]
+    # The defaults folded into one regex, so each URL is tested with a single search
+    DEFAULT_EXCLUDE_RE = re.compile('|'.join(f'(?:{p})' for p in DEFAULT_EXCLUDE_PATTERNS))
     
     # Sitemap URLs to check
     SITEMAP_LOCATIONS = [
@@ -31,6 +72,10 @@ class Config:
         "/wp-sitemap.xml"
     ]
     
+    # How long a host's sitemap probe result (found or not) is reused
+    SITEMAP_PROBE_TTL_SECONDS = 3600
+    SITEMAP_PROBE_MAX_ENTRIES = 256
+    
     # Crawler Limits
     DEFAULT_MAX_PAGES = 50
     DEFAULT_MAX_DEPTH = 3
@@ -47,6 +92,8 @@ class ScrapingMode:
     CUSTOM_SELECTORS = "Custom CSS Selectors"
     WEBSITE_CRAWLER = "Website Crawler"
     SITEMAP_SCRAPER = "Sitemap Scraper"
+    PEPTI_PRICES = "PeptiPrices (Specialized)"
+    PEP_PEDIA = "Pep-Pedia (Specialized)"
 
 class OutputFormat:
     """Enumeration of output formats."""
@@ -56,10 +103,21 @@ class OutputFormat:
     TXT = "TXT"
     XML = "XML"
 
-def parse_exclude_patterns(patterns_text: str) -> List[str]:
-    """Parse exclude patterns from text input."""
+def compile_exclude_patterns(patterns: List[str]) -> Pattern:
+    """Combine exclude patterns into a single compiled regex."""
+    if not patterns:
+        return Config.DEFAULT_EXCLUDE_RE
+    return re.compile('|'.join(f'(?:{p})' for p in patterns))
+
+@lru_cache(maxsize=32)
+def parse_exclude_patterns(patterns_text: str) -> Pattern:
+    """Parse exclude patterns from text input into one compiled regex.
+    
+    Cached on the raw text, since Streamlit re-sends the same sidebar input on
+    every rerun; compiled patterns are immutable, so sharing them is safe.
+    """
     if not patterns_text:
-        return Config.DEFAULT_EXCLUDE_PATTERNS
+        return Config.DEFAULT_EXCLUDE_RE
     
     patterns = []
     for pattern in patterns_text.strip().split('\n'):
@@ -71,13 +129,21 @@ def parse_exclude_patterns(patterns_text: str) -> List[str]:
             except re.error:
                 continue  # Skip invalid patterns
     
-    return patterns if patterns else Config.DEFAULT_EXCLUDE_PATTERNS
+    return compile_exclude_patterns(patterns)
 
 def parse_selectors(selectors_text: str) -> Dict[str, str]:
-    """Parse CSS selectors from text input."""
+    """Parse CSS selectors from text input.
+    
+    Returns a fresh dict each call, so callers may mutate it freely.
+    """
+    return dict(_parse_selector_pairs(selectors_text))
+
+@lru_cache(maxsize=32)
+def _parse_selector_pairs(selectors_text: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse selector text once per distinct input into immutable pairs."""
     selectors = {}
     if not selectors_text:
-        return selectors
+        return ()
     
     for line in selectors_text.strip().split('\n'):
         if ':' in line:
@@ -87,4 +153,4 @@ def parse_selectors(selectors_text: str) -> Dict[str, str]:
             if key and selector:
                 selectors[key] = selector
     
-    return selectors
+    return tuple(selectors.items())
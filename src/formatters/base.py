@@ -1,12 +1,74 @@
 """
-Base formatter class.
+Base formatter class and shared helpers.
 """
 
+import csv
 from abc import ABC, abstractmethod
-from typing import Union, List
+from io import StringIO
+from typing import Any, Dict, Iterable, List, Sequence, TextIO, Union
 from ..models import ScrapedPage
 
 
+def union_fieldnames(rows: Iterable[Dict[str, Any]]) -> List[str]:
+    """Union of row keys in first-seen order, gathered in a single pass."""
+    return list(dict.fromkeys(key for row in rows for key in row))
+
+
+def write_csv_rows(
+    output: TextIO,
+    rows: Iterable[Dict[str, Any]],
+    fieldnames: Sequence[str],
+    lineterminator: str = '\r\n'
+) -> int:
+    """Stream dict rows to ``output`` as CSV and return how many were written.
+    
+    Rows are consumed one at a time, so a generator never has to be
+    materialised. Nothing is written when ``rows`` is empty.
+    """
+    writer = csv.DictWriter(
+        output, fieldnames=fieldnames, restval="", extrasaction='ignore', lineterminator=lineterminator
+    )
+    count = 0
+    for row in rows:
+        if not count:
+            writer.writeheader()
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_csv_tuples(
+    output: TextIO,
+    rows: Iterable[Sequence[Any]],
+    header: Sequence[str],
+    lineterminator: str = '\r\n'
+) -> None:
+    """Stream positional rows under ``header`` to ``output``, skipping per-row dict building.
+    
+    Nothing is written when ``rows`` is empty.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return
+    
+    writer = csv.writer(output, lineterminator=lineterminator)
+    writer.writerow(header)
+    writer.writerow(first)
+    writer.writerows(rows)
+
+
+def tuples_to_csv(
+    rows: Iterable[Sequence[Any]],
+    header: Sequence[str],
+    lineterminator: str = '\r\n'
+) -> str:
+    """Write positional rows under ``header`` as CSV text."""
+    output = StringIO()
+    write_csv_tuples(output, rows, header, lineterminator)
+    return output.getvalue()
+
+
 class BaseFormatter(ABC):
     """Base class for all output formatters."""
     
@@ -15,6 +77,14 @@ class BaseFormatter(ABC):
         """Format data into specific output format."""
         pass
     
+    def format_to_stream(self, data: Union[ScrapedPage, List[ScrapedPage]], output: TextIO) -> None:
+        """Write formatted data to a text stream.
+        
+        Formatters that can emit output incrementally override this; the
+        default writes the result of ``format`` in one go.
+        """
+        output.write(self.format(data))
+    
     @abstractmethod
     def get_file_extension(self) -> str:
         """Get file extension for this format."""
@@ -2,12 +2,55 @@
 CSV formatter for scraped data.
 """
 
-import pandas as pd
 import json
 import os
-from typing import Union, List
+from itertools import repeat
+from functools import lru_cache
+from operator import itemgetter
+from io import StringIO
+from typing import Dict, Iterator, Optional, TextIO, Union, List
 from ..models import ScrapedPage
-from .base import BaseFormatter
+from .base import BaseFormatter, union_fieldnames, write_csv_rows, write_csv_tuples
+
+
+# Column layouts, kept identical to what the pandas-based writer produced
+PAGE_CSV_FIELDS = ('section_number', 'title', 'content', 'content_length')
+PAGES_CSV_FIELDS = ('page_number', 'page_url', 'section_number', 'title', 'content', 'content_length')
+PEPTI_PRICES_CSV_FIELDS = (
+    "compound_name", "dosage", "category", "source_url", "supplier",
+    "price_current", "price_original", "stock_status", "supplier_url", "full_text"
+)
+# Supplier keys backing the last six PeptiPrices columns, read in one map() per row
+SUPPLIER_CSV_KEYS = ("supplier", "price_current", "price_original", "stock_status", "url", "full_text")
+BACKLINKS_CSV_FIELDS = (
+    "page_url", "link_url", "link_text", "is_internal", "title", "target", "original_href"
+)
+# Backlink keys backing every column after page_url
+BACKLINK_CSV_KEYS = ("url", "link_text", "is_internal", "title", "target", "original_href")
+PEP_PEDIA_CATEGORIZED_FIELDS = (
+    "Overview", "Key Benefits", "Mechanism of Action", "Molecular Information",
+    "Research Indications", "Research Protocols", "Peptide Interactions",
+    "How to Reconstitute", "Quality Indicators", "What to Expect",
+    "Side Effects & Safety", "References", "Quick Start Guide",
+    "Storage", "Cycle Length", "Break Between"
+)
+
+# pandas.DataFrame.to_csv wrote bare newlines; keep exports byte-compatible
+CSV_LINE_TERMINATOR = '\n'
+
+
+@lru_cache(maxsize=4096)
+def compound_name_from_url(url: str) -> str:
+    """Derive a display compound name from a PeptiPrices product URL."""
+    if "/products/" in url:
+        return url.split("/products/")[-1].split("?")[0].replace("-", " ").replace("_", " ").title()
+    return "Unknown"
+
+
+@lru_cache(maxsize=256)
+def _molecular_column(key: str) -> str:
+    """Pep-Pedia column name for a molecular info key, e.g. 'Molecular Weight'."""
+    return f'molecular_{key.lower().replace(" ", "_")}'
 
 
 class CSVFormatter(BaseFormatter):
@@ -60,85 +103,88 @@ class CSVFormatter(BaseFormatter):
     
     def format(self, data: Union[ScrapedPage, List[ScrapedPage]]) -> str:
         """Format data as CSV."""
+        output = StringIO()
+        self.format_to_stream(data, output)
+        return output.getvalue()
+    
+    def format_to_stream(self, data: Union[ScrapedPage, List[ScrapedPage]], output: TextIO) -> None:
+        """Write CSV for ``data`` to a text stream.
+        
+        Plain title-content and backlink exports are written row by row, so
+        large crawls never hold the whole CSV in memory. Layouts that are
+        sorted or take their columns from the rows are collected first.
+        """
         if isinstance(data, ScrapedPage):
-            return self._format_single_page(data)
+            self._write_single_page(data, output)
         elif isinstance(data, list):
-            return self._format_multiple_pages(data)
-        else:
-            return ""
+            self._write_multiple_pages(data, output)
     
-    def _format_single_page(self, page: ScrapedPage) -> str:
-        """Format a single page as CSV."""
-        rows = []
-        
+    def _write_single_page(self, page: ScrapedPage, output: TextIO) -> None:
+        """Write a single page as CSV."""
         # Check for specialized data first
         if 'product_pricing' in page.custom_data:
-            return self._format_pepti_prices_csv(page)
+            return self._write_pepti_prices_csv(page, output)
         elif 'backlinks' in page.custom_data:
-            return self._format_backlinks_csv(page)
+            return self._write_backlinks_csv([page], output)
         elif 'categorized_content' in page.custom_data:
-            return self._format_pep_pedia_csv(page)
+            return self._write_pep_pedia_csv(page, output)
         
         # Default formatting for title-content pairs
-        for i, pair in enumerate(page.title_content_pairs, 1):
-            rows.append({
-                'section_number': i,
-                'title': pair.title,
-                'content': pair.content,
-                'content_length': len(pair.content)
-            })
-        
-        if rows:
-            df = pd.DataFrame(rows)
-            return df.to_csv(index=False)
-        return ""
+        rows = (
+            (i, pair.title, pair.content, len(pair.content))
+            for i, pair in enumerate(page.title_content_pairs, 1)
+        )
+        write_csv_tuples(output, rows, PAGE_CSV_FIELDS, CSV_LINE_TERMINATOR)
     
-    def _format_multiple_pages(self, pages: List[ScrapedPage]) -> str:
-        """Format multiple pages as CSV."""
-        rows = []
+    def _write_multiple_pages(self, pages: List[ScrapedPage], output: TextIO) -> None:
+        """Write multiple pages as CSV."""
+        if not pages:
+            return  # Failed crawls hand over an empty batch; there is nothing to write
+        
+        layout = self._specialized_layout(pages)
+        if layout == 'product_pricing':
+            return self._write_pepti_prices_csv_multiple(pages, output)
+        elif layout == 'backlinks':
+            return self._write_backlinks_csv(pages, output)
+        elif layout == 'categorized_content':
+            return self._write_pep_pedia_csv_multiple(pages, output)
         
-        # Check if any pages have specialized data
-        has_product_pricing = any('product_pricing' in page.custom_data for page in pages)
-        has_backlinks = any('backlinks' in page.custom_data for page in pages)
-        has_categorized_content = any('categorized_content' in page.custom_data for page in pages)
+        write_csv_tuples(output, self._iter_page_rows(pages), PAGES_CSV_FIELDS, CSV_LINE_TERMINATOR)
+    
+    def _specialized_layout(self, pages: List[ScrapedPage]) -> Optional[str]:
+        """Pick the specialized layout for a batch in one pass over the pages.
         
-        if has_product_pricing:
-            return self._format_pepti_prices_csv_multiple(pages)
-        elif has_backlinks:
-            return self._format_backlinks_csv_multiple(pages)
-        elif has_categorized_content:
-            return self._format_pep_pedia_csv_multiple(pages)
+        Pricing wins over backlinks, which win over categorized content,
+        whichever page they appear on.
+        """
+        found = set()
+        for page in pages:
+            custom_data = page.custom_data
+            if 'product_pricing' in custom_data:
+                return 'product_pricing'  # Highest priority; nothing later can override it
+            if 'backlinks' in custom_data:
+                found.add('backlinks')
+            elif 'categorized_content' in custom_data:
+                found.add('categorized_content')
         
-        # Default formatting for title-content pairs
+        for key in ('backlinks', 'categorized_content'):
+            if key in found:
+                return key
+        return None
+    
+    def _iter_page_rows(self, pages: List[ScrapedPage]) -> Iterator[tuple]:
+        """Yield default title-content row tuples one at a time."""
         for i, page in enumerate(pages, 1):
             for j, pair in enumerate(page.title_content_pairs, 1):
-                rows.append({
-                    'page_number': i,
-                    'page_url': page.url,
-                    'section_number': j,
-                    'title': pair.title,
-                    'content': pair.content,
-                    'content_length': len(pair.content)
-                })
-        
-        if rows:
-            df = pd.DataFrame(rows)
-            return df.to_csv(index=False)
-        return ""
+                yield (i, page.url, j, pair.title, pair.content, len(pair.content))
     
-    def _format_pepti_prices_csv(self, page: ScrapedPage) -> str:
-        """Format PeptiPrices data as CSV."""
-        products = page.custom_data.get("product_pricing", [])
-        rows = []
-        
-        # Extract compound name from the page URL or from searched_product
-        compound_name = page.custom_data.get("searched_product", "")
-        if not compound_name:
-            # Try to extract from URL
-            if "/products/" in page.url:
-                compound_name = page.url.split("/products/")[-1].split("?")[0].replace("-", " ").replace("_", " ").title()
-            else:
-                compound_name = "Unknown"
+    def _compound_name(self, page: ScrapedPage) -> str:
+        """Compound name from searched_product, falling back to the page URL."""
+        return page.custom_data.get("searched_product", "") or compound_name_from_url(page.url)
+    
+    def _iter_pepti_price_rows(self, page: ScrapedPage) -> Iterator[tuple]:
+        """Yield one PeptiPrices row tuple per supplier listed on a page."""
+        compound_name = self._compound_name(page)
         
         # Extract dosage information
         dosage = page.custom_data.get("dosage", "")
@@ -146,146 +192,60 @@ class CSVFormatter(BaseFormatter):
         # Get categories for this peptide
         categories = self._get_categories_for_peptide(compound_name)
         
-        for product in products:
+        row_prefix = (compound_name, dosage if dosage else "Standard", categories, page.url)
+        for product in page.custom_data.get("product_pricing", []):
             for supplier in product.get("suppliers", []):
-                rows.append({
-                    "compound_name": compound_name,
-                    "dosage": dosage if dosage else "Standard",
-                    "category": categories,
-                    "source_url": page.url,
-                    "supplier": supplier.get("supplier", ""),
-                    "price_current": supplier.get("price_current", ""),
-                    "price_original": supplier.get("price_original", ""),
-                    "stock_status": supplier.get("stock_status", ""),
-                    "supplier_url": supplier.get("url", ""),
-                    "full_text": supplier.get("full_text", "")
-                })
-        
-        if rows:
-            df = pd.DataFrame(rows)
-            # Sort by supplier for better organization
-            df = df.sort_values(['supplier'])
-            return df.to_csv(index=False)
-        return ""
+                yield (*row_prefix, *map(supplier.get, SUPPLIER_CSV_KEYS, repeat("")))
     
-    def _format_pepti_prices_csv_multiple(self, pages: List[ScrapedPage]) -> str:
-        """Format multiple PeptiPrices pages as CSV."""
-        all_rows = []
-        
-        for page in pages:
-            # Extract compound name from the page URL or from searched_product
-            compound_name = page.custom_data.get("searched_product", "")
-            if not compound_name:
-                # Try to extract from URL
-                if "/products/" in page.url:
-                    compound_name = page.url.split("/products/")[-1].split("?")[0].replace("-", " ").replace("_", " ").title()
-                else:
-                    compound_name = "Unknown"
-            
-            # Extract dosage information
-            dosage = page.custom_data.get("dosage", "")
-            
-            # Get categories for this peptide
-            categories = self._get_categories_for_peptide(compound_name)
-            
-            products = page.custom_data.get("product_pricing", [])
-            for product in products:
-                for supplier in product.get("suppliers", []):
-                    all_rows.append({
-                        "compound_name": compound_name,
-                        "dosage": dosage if dosage else "Standard",
-                        "category": categories,
-                        "source_url": page.url,
-                        "supplier": supplier.get("supplier", ""),
-                        "price_current": supplier.get("price_current", ""),
-                        "price_original": supplier.get("price_original", ""),
-                        "stock_status": supplier.get("stock_status", ""),
-                        "supplier_url": supplier.get("url", ""),
-                        "full_text": supplier.get("full_text", "")
-                    })
+    def _write_pepti_prices_csv(self, page: ScrapedPage, output: TextIO) -> None:
+        """Write PeptiPrices data as CSV."""
+        rows = list(self._iter_pepti_price_rows(page))
         
-        if all_rows:
-            df = pd.DataFrame(all_rows)
-            # Sort by compound name, then dosage, then supplier for better organization
-            df = df.sort_values(['compound_name', 'dosage', 'supplier'])
-            return df.to_csv(index=False)
-        return ""
+        # Sort by supplier for better organization
+        rows.sort(key=itemgetter(4))
+        write_csv_tuples(output, rows, PEPTI_PRICES_CSV_FIELDS, CSV_LINE_TERMINATOR)
     
-    def _format_backlinks_csv(self, page: ScrapedPage) -> str:
-        """Format backlinks data as CSV."""
-        backlinks = page.custom_data.get("backlinks", [])
-        rows = []
-        
-        for backlink in backlinks:
-            rows.append({
-                "page_url": page.url,
-                "link_url": backlink.get("url", ""),
-                "link_text": backlink.get("link_text", ""),
-                "is_internal": backlink.get("is_internal", ""),
-                "title": backlink.get("title", ""),
-                "target": backlink.get("target", ""),
-                "original_href": backlink.get("original_href", "")
-            })
+    def _write_pepti_prices_csv_multiple(self, pages: List[ScrapedPage], output: TextIO) -> None:
+        """Write multiple PeptiPrices pages as CSV."""
+        all_rows = [row for page in pages for row in self._iter_pepti_price_rows(page)]
         
-        if rows:
-            df = pd.DataFrame(rows)
-            return df.to_csv(index=False)
-        return ""
+        # Sort by compound name, then dosage, then supplier for better organization
+        all_rows.sort(key=itemgetter(0, 1, 4))
+        write_csv_tuples(output, all_rows, PEPTI_PRICES_CSV_FIELDS, CSV_LINE_TERMINATOR)
     
-    def _format_backlinks_csv_multiple(self, pages: List[ScrapedPage]) -> str:
-        """Format multiple pages' backlinks as CSV."""
-        all_rows = []
-        
-        for page in pages:
-            backlinks = page.custom_data.get("backlinks", [])
-            for backlink in backlinks:
-                all_rows.append({
-                    "page_url": page.url,
-                    "link_url": backlink.get("url", ""),
-                    "link_text": backlink.get("link_text", ""),
-                    "is_internal": backlink.get("is_internal", ""),
-                    "title": backlink.get("title", ""),
-                    "target": backlink.get("target", ""),
-                    "original_href": backlink.get("original_href", "")
-                })
-        
-        if all_rows:
-            df = pd.DataFrame(all_rows)
-            return df.to_csv(index=False)
-        return ""
+    def _iter_backlink_rows(self, page: ScrapedPage) -> Iterator[tuple]:
+        """Yield one row tuple per backlink found on a page."""
+        for backlink in page.custom_data.get("backlinks", []):
+            yield (page.url, *map(backlink.get, BACKLINK_CSV_KEYS, repeat("")))
+    
+    def _write_backlinks_csv(self, pages: List[ScrapedPage], output: TextIO) -> None:
+        """Write the backlinks of one or more pages as CSV."""
+        rows = (row for page in pages for row in self._iter_backlink_rows(page))
+        write_csv_tuples(output, rows, BACKLINKS_CSV_FIELDS, CSV_LINE_TERMINATOR)
     
-    def _format_pep_pedia_csv(self, page: ScrapedPage) -> str:
-        """Format Pep-Pedia categorized content as CSV with route separation."""
+    def _iter_pep_pedia_rows(self, page: ScrapedPage) -> Iterator[Dict]:
+        """Yield one Pep-Pedia row per administration route of a page."""
         categorized_content = page.custom_data.get("categorized_content", {})
         peptide_name = page.custom_data.get("searched_product", "")
         content_by_route = page.custom_data.get("content_by_route", {})
         peptide_info = page.custom_data.get("peptide_info", {})
         
-        rows = []
-        
         # Get all available routes
         routes = content_by_route.keys() if content_by_route else ['oral']  # Default to oral if no route data
         
+        # Everything but the route is per page, so build it once and copy it for each route
+        base_row = {
+            'peptide_name': peptide_name,
+            'route': None,  # Placeholder that keeps the column in second position
+            'source_url': page.url,
+            'scraped_at': page.scraped_at
+        }
+        base_row.update((field, categorized_content.get(field, "")) for field in PEP_PEDIA_CATEGORIZED_FIELDS)
+        
         for route in routes:
             # Create a row for each route
-            row = {
-                'peptide_name': peptide_name,
-                'route': route,
-                'source_url': page.url,
-                'scraped_at': page.scraped_at
-            }
-            
-            # Add all categorized fields
-            categorized_fields = [
-                "Overview", "Key Benefits", "Mechanism of Action", "Molecular Information",
-                "Research Indications", "Research Protocols", "Peptide Interactions",
-                "How to Reconstitute", "Quality Indicators", "What to Expect",
-                "Side Effects & Safety", "References", "Quick Start Guide",
-                "Storage", "Cycle Length", "Break Between"
-            ]
-            
-            for field in categorized_fields:
-                row[field] = categorized_content.get(field, "")
+            row = base_row.copy()
+            row['route'] = route
             
             # Add route-specific peptide info if available
             if peptide_info and route in peptide_info:
@@ -299,7 +259,7 @@ class CSVFormatter(BaseFormatter):
                 if 'molecular_info' in route_peptide_info:
                     mol_info = route_peptide_info['molecular_info']
                     for key, value in mol_info.items():
-                        row[f'molecular_{key.lower().replace(" ", "_")}'] = value
+                        row[_molecular_column(key)] = value
                 
                 # Add benefits
                 if 'benefits' in route_peptide_info:
@@ -342,132 +302,29 @@ class CSVFormatter(BaseFormatter):
             if content_by_route and route in content_by_route:
                 route_content = content_by_route[route]
                 if route_content:
-                    # Combine all content for this route
-                    all_titles = []
-                    all_contents = []
-                    for content_pair in route_content:
-                        if isinstance(content_pair, dict):
-                            all_titles.append(content_pair.get('title', ''))
-                            all_contents.append(content_pair.get('content', ''))
-                    
-                    row['route_content_titles'] = ' | '.join(all_titles)
-                    row['route_content'] = ' \n\n '.join(all_contents)
+                    # Combine all content for this route, filtering out non-dict entries once
+                    pairs = [cp for cp in route_content if isinstance(cp, dict)]
+                    row['route_content_titles'] = ' | '.join(cp.get('title', '') for cp in pairs)
+                    row['route_content'] = ' \n\n '.join(cp.get('content', '') for cp in pairs)
             
-            rows.append(row)
-        
-        if rows:
-            df = pd.DataFrame(rows)
-            return df.to_csv(index=False)
-        return ""
+            yield row
+
+    def _write_pep_pedia_csv(self, page: ScrapedPage, output: TextIO) -> None:
+        """Write Pep-Pedia categorized content as CSV with route separation."""
+        # Columns vary with the molecular info found, so take the union of row keys
+        rows = list(self._iter_pep_pedia_rows(page))
+        write_csv_rows(output, rows, union_fieldnames(rows), CSV_LINE_TERMINATOR)
     
-    def _format_pep_pedia_csv_multiple(self, pages: List[ScrapedPage]) -> str:
-        """Format multiple Pep-Pedia pages with categorized content as CSV with route separation."""
-        all_rows = []
+    def _write_pep_pedia_csv_multiple(self, pages: List[ScrapedPage], output: TextIO) -> None:
+        """Write multiple Pep-Pedia pages with categorized content as CSV with route separation."""
+        all_rows = [row for page in pages for row in self._iter_pep_pedia_rows(page)]
         
-        for page in pages:
-            categorized_content = page.custom_data.get("categorized_content", {})
-            peptide_name = page.custom_data.get("searched_product", "")
-            content_by_route = page.custom_data.get("content_by_route", {})
-            peptide_info = page.custom_data.get("peptide_info", {})
-            
-            # Get all available routes
-            routes = content_by_route.keys() if content_by_route else ['oral']  # Default to oral if no route data
-            
-            for route in routes:
-                # Create a row for each route
-                row = {
-                    'peptide_name': peptide_name,
-                    'route': route,
-                    'source_url': page.url,
-                    'scraped_at': page.scraped_at
-                }
-                
-                # Add all categorized fields
-                categorized_fields = [
-                    "Overview", "Key Benefits", "Mechanism of Action", "Molecular Information",
-                    "Research Indications", "Research Protocols", "Peptide Interactions",
-                    "How to Reconstitute", "Quality Indicators", "What to Expect",
-                    "Side Effects & Safety", "References", "Quick Start Guide",
-                    "Storage", "Cycle Length", "Break Between"
-                ]
-                
-                for field in categorized_fields:
-                    row[field] = categorized_content.get(field, "")
-                
-                # Add route-specific peptide info if available
-                if peptide_info and route in peptide_info:
-                    route_peptide_info = peptide_info[route]
-                    
-                    # Add specific peptide info fields
-                    if 'name' in route_peptide_info:
-                        row['peptide_display_name'] = route_peptide_info['name']
-                    
-                    # Add molecular info
-                    if 'molecular_info' in route_peptide_info:
-                        mol_info = route_peptide_info['molecular_info']
-                        for key, value in mol_info.items():
-                            row[f'molecular_{key.lower().replace(" ", "_")}'] = value
-                    
-                    # Add benefits
-                    if 'benefits' in route_peptide_info:
-                        benefits = route_peptide_info['benefits']
-                        if isinstance(benefits, list):
-                            row['benefits'] = '; '.join(benefits)
-                        else:
-                            row['benefits'] = str(benefits)
-                    
-                    # Add mechanism
-                    if 'mechanism_of_action' in route_peptide_info:
-                        row['route_mechanism'] = route_peptide_info['mechanism_of_action']
-                    
-                    # Add research indications
-                    if 'research_indications' in route_peptide_info:
-                        indications = route_peptide_info['research_indications']
-                        if isinstance(indications, list):
-                            row['route_indications'] = '; '.join(indications)
-                        else:
-                            row['route_indications'] = str(indications)
-                    
-                    # Add protocols
-                    if 'protocols' in route_peptide_info:
-                        protocols = route_peptide_info['protocols']
-                        if isinstance(protocols, list):
-                            protocol_texts = []
-                            for protocol in protocols:
-                                if isinstance(protocol, dict):
-                                    protocol_text = protocol.get('description', '')
-                                    if 'details' in protocol:
-                                        protocol_text += f" - {protocol['details']}"
-                                    protocol_texts.append(protocol_text)
-                                else:
-                                    protocol_texts.append(str(protocol))
-                            row['route_protocols'] = '; '.join(protocol_texts)
-                        else:
-                            row['route_protocols'] = str(protocols)
-                
-                # Add content sections for this route
-                if content_by_route and route in content_by_route:
-                    route_content = content_by_route[route]
-                    if route_content:
-                        # Combine all content for this route
-                        all_titles = []
-                        all_contents = []
-                        for content_pair in route_content:
-                            if isinstance(content_pair, dict):
-                                all_titles.append(content_pair.get('title', ''))
-                                all_contents.append(content_pair.get('content', ''))
-                        
-                        row['route_content_titles'] = ' | '.join(all_titles)
-                        row['route_content'] = ' \n\n '.join(all_contents)
-                
-                all_rows.append(row)
+        # Column order follows the rows as produced, so collect it before sorting
+        fieldnames = union_fieldnames(all_rows)
         
-        if all_rows:
-            df = pd.DataFrame(all_rows)
-            # Sort by peptide name, then route for better organization
-            df = df.sort_values(['peptide_name', 'route'])
-            return df.to_csv(index=False)
-        return ""
+        # Sort by peptide name, then route for better organization
+        all_rows.sort(key=itemgetter('peptide_name', 'route'))
+        write_csv_rows(output, all_rows, fieldnames, CSV_LINE_TERMINATOR)
     
     def get_file_extension(self) -> str:
         """Return CSV file extension."""
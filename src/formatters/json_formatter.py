@@ -3,22 +3,57 @@ JSON formatter for scraped data.
 """
 
 import json
-from typing import Union, List
+from io import StringIO
+from typing import Any, TextIO, Union, List
 from ..models import ScrapedPage
 from .base import BaseFormatter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize an object as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
 
 class JSONFormatter(BaseFormatter):
     """Formatter for JSON output."""
     
     def format(self, data: Union[ScrapedPage, List[ScrapedPage]]) -> str:
         """Format data as JSON."""
+        output = StringIO()
+        self.format_to_stream(data, output)
+        return output.getvalue()
+    
+    def format_to_stream(self, data: Union[ScrapedPage, List[ScrapedPage]], output: TextIO) -> None:
+        """Write JSON for ``data`` to a text stream.
+        
+        Page lists are serialized one page at a time inside a hand-written
+        array, so only a single page dict exists at once.
+        """
         if isinstance(data, ScrapedPage):
-            return json.dumps(data.to_dict(), indent=2, ensure_ascii=False)
-        elif isinstance(data, list):
-            return json.dumps([page.to_dict() for page in data], indent=2, ensure_ascii=False)
-        else:
-            return json.dumps({}, indent=2, ensure_ascii=False)
+            output.write(dumps_json(data.to_dict()))
+            return
+        if not isinstance(data, list):
+            output.write(dumps_json({}))
+            return
+        if not data:
+            output.write(dumps_json([]))
+            return
+        
+        output.write('[\n')
+        for i, page in enumerate(data):
+            if i:
+                output.write(',\n')
+            # Newlines only occur between tokens (never inside strings), so
+            # indenting after each one nests the page one level into the array
+            output.write('  ' + dumps_json(page.to_dict()).replace('\n', '\n  '))
+        output.write('\n]')
     
     def get_file_extension(self) -> str:
         """Return JSON file extension."""
@@ -2,12 +2,19 @@
 Specialized formatters for structured peptide data.
 """
 
-import json
-import csv
-from io import StringIO
-from typing import Union, List
+from itertools import repeat
+from typing import Iterator, Union, List
 from ..models import ScrapedPage
-from .base import BaseFormatter
+from .base import BaseFormatter, tuples_to_csv
+from .json_formatter import dumps_json
+
+
+PRICING_CSV_FIELDS = (
+    "product_name", "supplier", "price_current", "price_original",
+    "stock_status", "url", "full_text"
+)
+# Supplier keys backing every pricing column after product_name
+PRICING_SUPPLIER_KEYS = PRICING_CSV_FIELDS[1:]
 
 
 class PeptideInfoFormatter(BaseFormatter):
@@ -20,7 +27,7 @@ class PeptideInfoFormatter(BaseFormatter):
         elif isinstance(data, list):
             return self._format_multiple_pages(data)
         else:
-            return json.dumps({"error": "No data available"}, indent=2)
+            return dumps_json({"error": "No data available"})
     
     def _format_single_page(self, page: ScrapedPage) -> str:
         """Format a single peptide page."""
@@ -39,23 +46,24 @@ class PeptideInfoFormatter(BaseFormatter):
             ]
         }
         
-        return json.dumps(output, indent=2, ensure_ascii=False)
+        return dumps_json(output)
     
     def _format_multiple_pages(self, pages: List[ScrapedPage]) -> str:
         """Format multiple peptide pages."""
         peptides = []
         
         for page in pages:
+            peptide_info = page.custom_data.get("peptide_info", {})
             peptide_data = {
-                "name": page.custom_data.get("peptide_info", {}).get("name", "Unknown"),
+                "name": peptide_info.get("name", "Unknown"),
                 "url": page.url,
                 "scraped_at": page.scraped_at,
-                "molecular_info": page.custom_data.get("peptide_info", {}).get("molecular_info", {}),
-                "benefits": page.custom_data.get("peptide_info", {}).get("benefits", []),
-                "mechanism_of_action": page.custom_data.get("peptide_info", {}).get("mechanism_of_action", ""),
-                "research_indications": page.custom_data.get("peptide_info", {}).get("research_indications", []),
-                "quality_indicators": page.custom_data.get("peptide_info", {}).get("quality_indicators", []),
-                "protocols": page.custom_data.get("peptide_info", {}).get("protocols", {}),
+                "molecular_info": peptide_info.get("molecular_info", {}),
+                "benefits": peptide_info.get("benefits", []),
+                "mechanism_of_action": peptide_info.get("mechanism_of_action", ""),
+                "research_indications": peptide_info.get("research_indications", []),
+                "quality_indicators": peptide_info.get("quality_indicators", []),
+                "protocols": peptide_info.get("protocols", {}),
                 "content_sections": [
                     {
                         "title": pair.title,
@@ -65,11 +73,11 @@ class PeptideInfoFormatter(BaseFormatter):
             }
             peptides.append(peptide_data)
         
-        return json.dumps({
+        return dumps_json({
             "peptides": peptides,
             "total_count": len(peptides),
             "scraped_at": pages[0].scraped_at if pages else ""
-        }, indent=2, ensure_ascii=False)
+        })
     
     def get_file_extension(self) -> str:
         return "json"
@@ -88,7 +96,7 @@ class PricingDataFormatter(BaseFormatter):
         elif isinstance(data, list):
             return self._format_multiple_pages(data)
         else:
-            return json.dumps({"error": "No data available"}, indent=2)
+            return dumps_json({"error": "No data available"})
     
     def _format_single_page(self, page: ScrapedPage) -> str:
         """Format a single pricing page."""
@@ -103,7 +111,7 @@ class PricingDataFormatter(BaseFormatter):
             "products": products
         }
         
-        return json.dumps(output, indent=2, ensure_ascii=False)
+        return dumps_json(output)
     
     def _format_multiple_pages(self, pages: List[ScrapedPage]) -> str:
         """Format multiple pricing pages."""
@@ -113,22 +121,22 @@ class PricingDataFormatter(BaseFormatter):
             products = page.custom_data.get("product_pricing", [])
             all_products.extend(products)
         
-        return json.dumps({
+        return dumps_json({
             "pricing_comparison": {
                 "products": all_products,
                 "total_products": len(all_products),
                 "unique_suppliers": self._count_unique_suppliers(all_products),
                 "last_updated": pages[0].scraped_at if pages else ""
             }
-        }, indent=2, ensure_ascii=False)
+        })
     
     def _count_unique_suppliers(self, products: List[dict]) -> int:
         """Count unique suppliers across all products."""
-        suppliers = set()
-        for product in products:
-            for supplier in product.get("suppliers", []):
-                suppliers.add(supplier.get("supplier", "Unknown"))
-        return len(suppliers)
+        return len({
+            supplier.get("supplier", "Unknown")
+            for product in products
+            for supplier in product.get("suppliers", [])
+        })
     
     def get_file_extension(self) -> str:
         return "json"
@@ -151,64 +159,20 @@ class PricingCSVFormatter(BaseFormatter):
     
     def _format_single_page_csv(self, page: ScrapedPage) -> str:
         """Format single page as CSV."""
-        products = page.custom_data.get("product_pricing", [])
-        rows = []
-        
-        for product in products:
-            product_name = product.get("product_name", "")
-            for supplier in product.get("suppliers", []):
-                rows.append({
-                    "product_name": product_name,
-                    "supplier": supplier.get("supplier", ""),
-                    "price_current": supplier.get("price_current", ""),
-                    "price_original": supplier.get("price_original", ""),
-                    "stock_status": supplier.get("stock_status", ""),
-                    "url": supplier.get("url", ""),
-                    "full_text": supplier.get("full_text", "")
-                })
-        
-        if rows:
-            output = StringIO()
-            writer = csv.DictWriter(output, fieldnames=[
-                "product_name", "supplier", "price_current", "price_original", 
-                "stock_status", "url", "full_text"
-            ])
-            writer.writeheader()
-            writer.writerows(rows)
-            return output.getvalue()
-        
-        return ""
+        return tuples_to_csv(self._iter_pricing_rows(page), PRICING_CSV_FIELDS)
     
     def _format_multiple_pages_csv(self, pages: List[ScrapedPage]) -> str:
         """Format multiple pages as CSV."""
-        all_rows = []
-        
-        for page in pages:
-            products = page.custom_data.get("product_pricing", [])
-            for product in products:
-                product_name = product.get("product_name", "")
-                for supplier in product.get("suppliers", []):
-                    all_rows.append({
-                        "product_name": product_name,
-                        "supplier": supplier.get("supplier", ""),
-                        "price_current": supplier.get("price_current", ""),
-                        "price_original": supplier.get("price_original", ""),
-                        "stock_status": supplier.get("stock_status", ""),
-                        "url": supplier.get("url", ""),
-                        "full_text": supplier.get("full_text", "")
-                    })
-        
-        if all_rows:
-            output = StringIO()
-            writer = csv.DictWriter(output, fieldnames=[
-                "product_name", "supplier", "price_current", "price_original", 
-                "stock_status", "url", "full_text"
-            ])
-            writer.writeheader()
-            writer.writerows(all_rows)
-            return output.getvalue()
-        
-        return ""
+        return tuples_to_csv(
+            (row for page in pages for row in self._iter_pricing_rows(page)), PRICING_CSV_FIELDS
+        )
+    
+    def _iter_pricing_rows(self, page: ScrapedPage) -> Iterator[tuple]:
+        """Yield one row tuple per supplier of every product on a page."""
+        for product in page.custom_data.get("product_pricing", []):
+            product_name = product.get("product_name", "")
+            for supplier in product.get("suppliers", []):
+                yield (product_name, *map(supplier.get, PRICING_SUPPLIER_KEYS, repeat("")))
     
     def get_file_extension(self) -> str:
         return "csv"
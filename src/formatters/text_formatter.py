@@ -2,112 +2,125 @@
 Text formatter for scraped data.
 """
 
-from typing import Union, List
+from io import StringIO
+from typing import TextIO, Union, List
 from ..models import ScrapedPage
 from .base import BaseFormatter
 
 
+# Rules framing sections and pages, built once rather than per section
+SECTION_RULE = '=' * 80
+SECTION_DIVIDER = '─' * 80
+PAGE_RULE = '=' * 100
+PAGE_DIVIDER = '─' * 100
+HEADING_RULE = '─' * 64
+
+# Static report banners
+PAGE_REPORT_BANNER = """╔══════════════════════════════════════════════════════════════╗
+║                    🕷️ WEB SCRAPING REPORT                    ║
+╚══════════════════════════════════════════════════════════════╝
+
+"""
+WEBSITE_REPORT_BANNER = """╔══════════════════════════════════════════════════════════════╗
+║                🕷️ WEBSITE SCRAPING REPORT                ║
+╚══════════════════════════════════════════════════════════════╝
+
+"""
+END_OF_REPORT_BANNER = """╔══════════════════════════════════════════════════════════════╗
+║                        END OF REPORT                        ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+
 class TextFormatter(BaseFormatter):
     """Formatter for plain text output."""
     
     def format(self, data: Union[ScrapedPage, List[ScrapedPage]]) -> str:
         """Format data as plain text."""
+        output = StringIO()
+        self.format_to_stream(data, output)
+        return output.getvalue()
+    
+    def format_to_stream(self, data: Union[ScrapedPage, List[ScrapedPage]], output: TextIO) -> None:
+        """Write the text report for ``data`` to a text stream as it is built."""
         if isinstance(data, ScrapedPage):
-            return self._format_single_page(data)
+            self._write_single_page(data, output)
         elif isinstance(data, list):
-            return self._format_multiple_pages(data)
+            self._write_multiple_pages(data, output)
         else:
-            return "No data available"
+            output.write("No data available")
     
-    def _format_single_page(self, page: ScrapedPage) -> str:
-        """Format a single page as text."""
-        text = f"""╔══════════════════════════════════════════════════════════════╗
-║                    🕷️ WEB SCRAPING REPORT                    ║
-╚══════════════════════════════════════════════════════════════╝
-
-📊 BASIC INFORMATION
-────────────────────────────────────────────────────────────────
+    def _write_single_page(self, page: ScrapedPage, output: TextIO) -> None:
+        """Write a single page as text."""
+        write = output.write
+        write(PAGE_REPORT_BANNER)
+        write(f"""📊 BASIC INFORMATION
+{HEADING_RULE}
 URL: {page.url}
 Scraped at: {page.scraped_at}
 
 📈 CONTENT STATISTICS
-────────────────────────────────────────────────────────────────
+{HEADING_RULE}
 Title-Content Pairs: {len(page.title_content_pairs)}
 Total Characters: {sum(len(pair.content) for pair in page.title_content_pairs)}
 
-"""
+""")
         
         # Title-Content Pairs
         if page.title_content_pairs:
-            text += "📋 TITLE-CONTENT PAIRS\n────────────────────────────────────────────────────────────────\n"
+            write(f"📋 TITLE-CONTENT PAIRS\n{HEADING_RULE}\n")
             for i, pair in enumerate(page.title_content_pairs, 1):
                 title = pair.title
                 content = pair.content
                 
-                text += f"\n{'='*80}\n"
-                text += f"SECTION {i}\n"
-                text += f"{'='*80}\n"
-                text += f"TITLE: {title}\n"
-                text += f"{'─'*80}\n"
+                write(f"\n{SECTION_RULE}\nSECTION {i}\n{SECTION_RULE}\nTITLE: {title}\n{SECTION_DIVIDER}\n")
                 if content:
-                    text += f"CONTENT:\n{content}\n"
+                    write(f"CONTENT:\n{content}\n")
                 else:
-                    text += f"CONTENT:\nNo content found for this section\n"
-                text += f"\n"
+                    write(f"CONTENT:\nNo content found for this section\n")
+                write(f"\n")
         
-        text += "╔══════════════════════════════════════════════════════════════╗\n"
-        text += "║                        END OF REPORT                        ║\n"
-        text += "╚══════════════════════════════════════════════════════════════╝\n"
-        
-        return text
+        write(END_OF_REPORT_BANNER)
     
-    def _format_multiple_pages(self, pages: List[ScrapedPage]) -> str:
-        """Format multiple pages as text."""
+    def _write_multiple_pages(self, pages: List[ScrapedPage], output: TextIO) -> None:
+        """Write multiple pages as text."""
         total_pairs = sum(len(page.title_content_pairs) for page in pages)
-        total_chars = sum(sum(len(pair.content) for pair in page.title_content_pairs) for page in pages)
+        total_chars = sum(len(pair.content) for page in pages for pair in page.title_content_pairs)
         
-        text = f"""╔══════════════════════════════════════════════════════════════╗
-║                🕷️ WEBSITE SCRAPING REPORT                ║
-╚══════════════════════════════════════════════════════════════╝
-
-📊 SUMMARY STATISTICS
-────────────────────────────────────────────────────────────────
+        write = output.write
+        write(WEBSITE_REPORT_BANNER)
+        write(f"""📊 SUMMARY STATISTICS
+{HEADING_RULE}
 Total Pages: {len(pages)}
 Total Sections: {total_pairs}
 Total Characters: {total_chars}
 
-"""
+""")
         
         for i, page in enumerate(pages, 1):
-            text += f"\n{'='*100}\n"
-            text += f"PAGE {i}\n"
-            text += f"{'='*100}\n"
-            text += f"URL: {page.url}\n"
-            text += f"Scraped at: {page.scraped_at}\n"
-            text += f"Sections: {len(page.title_content_pairs)}\n"
-            text += f"{'─'*100}\n"
+            write(
+                f"\n{PAGE_RULE}\nPAGE {i}\n{PAGE_RULE}\n"
+                f"URL: {page.url}\nScraped at: {page.scraped_at}\n"
+                f"Sections: {len(page.title_content_pairs)}\n{PAGE_DIVIDER}\n"
+            )
             
             if page.title_content_pairs:
                 for j, pair in enumerate(page.title_content_pairs, 1):
                     title = pair.title
                     content = pair.content
                     
-                    text += f"\n  {'─'*80}\n"
-                    text += f"  SECTION {j}\n"
-                    text += f"  {'─'*80}\n"
-                    text += f"  TITLE: {title}\n"
-                    text += f"  {'─'*80}\n"
+                    write(
+                        f"\n  {SECTION_DIVIDER}\n  SECTION {j}\n  {SECTION_DIVIDER}\n"
+                        f"  TITLE: {title}\n  {SECTION_DIVIDER}\n"
+                    )
                     if content:
-                        text += f"  CONTENT:\n  {content}\n"
+                        write(f"  CONTENT:\n  {content}\n")
                     else:
-                        text += f"  CONTENT:\n  No content found for this section\n"
-                    text += f"\n"
-        
-        text += "\n╔══════════════════════════════════════════════════════════════╗\n"
-        text += "║                        END OF REPORT                        ║\n"
-        text += "╚══════════════════════════════════════════════════════════════╝\n"
+                        write(f"  CONTENT:\n  No content found for this section\n")
+                    write(f"\n")
         
-        return text
+        write("\n")
+        write(END_OF_REPORT_BANNER)
     
     def get_file_extension(self) -> str:
         """Return text file extension."""
@@ -2,98 +2,105 @@
 XML formatter for scraped data.
 """
 
-from typing import Union, List
+from io import StringIO
+from typing import TextIO, Union, List
+from xml.sax.saxutils import escape
 from ..models import ScrapedPage
 from .base import BaseFormatter
 
 
+# Quote entities on top of the &, < and > that saxutils.escape always handles
+_QUOTE_ENTITIES = {'"': '&quot;', "'": '&apos;'}
+_XML_SPECIAL_CHARS = ('&', '<', '>', '"', "'")
+
+
 class XMLFormatter(BaseFormatter):
     """Formatter for XML output."""
     
     def format(self, data: Union[ScrapedPage, List[ScrapedPage]]) -> str:
         """Format data as XML."""
+        output = StringIO()
+        self.format_to_stream(data, output)
+        return output.getvalue()
+    
+    def format_to_stream(self, data: Union[ScrapedPage, List[ScrapedPage]], output: TextIO) -> None:
+        """Write the XML document for ``data`` to a text stream as it is built."""
         if isinstance(data, ScrapedPage):
-            return self._format_single_page(data)
+            self._write_single_page(data, output)
         elif isinstance(data, list):
-            return self._format_multiple_pages(data)
+            self._write_multiple_pages(data, output)
         else:
-            return '<?xml version="1.0" encoding="UTF-8"?><scraped_content></scraped_content>'
+            output.write('<?xml version="1.0" encoding="UTF-8"?><scraped_content></scraped_content>')
     
-    def _format_single_page(self, page: ScrapedPage) -> str:
-        """Format a single page as XML."""
-        xml = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        xml += '<scraped_content>\n'
-        xml += f'  <url>{page.url}</url>\n'
-        xml += f'  <scraped_at>{page.scraped_at}</scraped_at>\n'
+    def _write_single_page(self, page: ScrapedPage, output: TextIO) -> None:
+        """Write a single page as XML."""
+        write = output.write
+        write('<?xml version="1.0" encoding="UTF-8"?>\n<scraped_content>\n')
+        write(f'  <url>{self._escape_xml(page.url)}</url>\n')
+        write(f'  <scraped_at>{self._escape_xml(page.scraped_at)}</scraped_at>\n')
         
-        xml += '  <title_content_pairs>\n'
+        write('  <title_content_pairs>\n')
         for i, pair in enumerate(page.title_content_pairs, 1):
-            xml += f'    <pair id="{i}">\n'
-            xml += f'      <title>{self._escape_xml(pair.title)}</title>\n'
-            xml += f'      <content>{self._escape_xml(pair.content)}</content>\n'
-            xml += f'    </pair>\n'
-        xml += '  </title_content_pairs>\n'
+            write(f'    <pair id="{i}">\n')
+            write(f'      <title>{self._escape_xml(pair.title)}</title>\n')
+            write(f'      <content>{self._escape_xml(pair.content)}</content>\n')
+            write('    </pair>\n')
+        write('  </title_content_pairs>\n')
         
         # Add custom data if present
         if page.custom_data:
-            xml += '  <custom_data>\n'
+            write('  <custom_data>\n')
             for key, value in page.custom_data.items():
-                xml += f'    <{key}>{self._escape_xml(str(value))}</{key}>\n'
-            xml += '  </custom_data>\n'
+                write(f'    <{key}>{self._escape_xml(str(value))}</{key}>\n')
+            write('  </custom_data>\n')
         
-        xml += '</scraped_content>\n'
-        return xml
+        write('</scraped_content>\n')
     
-    def _format_multiple_pages(self, pages: List[ScrapedPage]) -> str:
-        """Format multiple pages as XML."""
-        xml = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        xml += '<website_scraping_report>\n'
-        xml += f'  <summary>\n'
-        xml += f'    <total_pages>{len(pages)}</total_pages>\n'
-        xml += f'    <total_sections>{sum(len(page.title_content_pairs) for page in pages)}</total_sections>\n'
-        xml += f'    <total_characters>{sum(sum(len(pair.content) for pair in page.title_content_pairs) for page in pages)}</total_characters>\n'
-        xml += f'  </summary>\n'
-        xml += f'  <pages>\n'
+    def _write_multiple_pages(self, pages: List[ScrapedPage], output: TextIO) -> None:
+        """Write multiple pages as XML."""
+        write = output.write
+        write('<?xml version="1.0" encoding="UTF-8"?>\n<website_scraping_report>\n')
+        write('  <summary>\n')
+        write(f'    <total_pages>{len(pages)}</total_pages>\n')
+        write(f'    <total_sections>{sum(len(page.title_content_pairs) for page in pages)}</total_sections>\n')
+        write(f'    <total_characters>{sum(len(pair.content) for page in pages for pair in page.title_content_pairs)}</total_characters>\n')
+        write('  </summary>\n')
+        write('  <pages>\n')
         
         for i, page in enumerate(pages, 1):
-            xml += f'    <page id="{i}">\n'
-            xml += f'      <url>{page.url}</url>\n'
-            xml += f'      <scraped_at>{page.scraped_at}</scraped_at>\n'
+            write(f'    <page id="{i}">\n')
+            write(f'      <url>{self._escape_xml(page.url)}</url>\n')
+            write(f'      <scraped_at>{self._escape_xml(page.scraped_at)}</scraped_at>\n')
             
-            xml += f'      <title_content_pairs>\n'
+            write('      <title_content_pairs>\n')
             for j, pair in enumerate(page.title_content_pairs, 1):
-                xml += f'        <pair id="{j}">\n'
-                xml += f'          <title>{self._escape_xml(pair.title)}</title>\n'
-                xml += f'          <content>{self._escape_xml(pair.content)}</content>\n'
-                xml += f'        </pair>\n'
-            xml += f'      </title_content_pairs>\n'
+                write(f'        <pair id="{j}">\n')
+                write(f'          <title>{self._escape_xml(pair.title)}</title>\n')
+                write(f'          <content>{self._escape_xml(pair.content)}</content>\n')
+                write('        </pair>\n')
+            write('      </title_content_pairs>\n')
             
             # Add custom data if present
             if page.custom_data:
-                xml += f'      <custom_data>\n'
+                write('      <custom_data>\n')
                 for key, value in page.custom_data.items():
-                    xml += f'        <{key}>{self._escape_xml(str(value))}</{key}>\n'
-                xml += f'      </custom_data>\n'
+                    write(f'        <{key}>{self._escape_xml(str(value))}</{key}>\n')
+                write('      </custom_data>\n')
             
-            xml += f'    </page>\n'
+            write('    </page>\n')
         
-        xml += f'  </pages>\n'
-        xml += f'</website_scraping_report>\n'
-        return xml
+        write('  </pages>\n')
+        write('</website_scraping_report>\n')
     
     def _escape_xml(self, text: str) -> str:
         """Escape XML special characters."""
         if not text:
             return ""
         
-        # Basic XML escaping
-        text = text.replace('&', '&amp;')
-        text = text.replace('<', '&lt;')
-        text = text.replace('>', '&gt;')
-        text = text.replace('"', '&quot;')
-        text = text.replace("'", '&apos;')
-        
-        return text
+        # Most scraped text has nothing to escape; each `in` test is a single C scan
+        if not any(char in text for char in _XML_SPECIAL_CHARS):
+            return text
+        return escape(text, _QUOTE_ENTITIES)
     
     def get_file_extension(self) -> str:
         """Return XML file extension."""
@@ -6,14 +6,14 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class TitleContentPair:
     """Represents a title-content pair from a webpage."""
     title: str
     content: str
     section_number: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedPage:
     """Represents a scraped webpage with its metadata."""
     url: str
@@ -59,7 +59,7 @@ class ScrapedPage:
             **self.custom_data
         }
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingStats:
     """Statistics for a scraping operation."""
     total_pages: int
@@ -85,7 +85,7 @@ class ScrapingStats:
             duration_seconds=duration
         )
 
-@dataclass
+@dataclass(slots=True)
 class SitemapInfo:
     """Information about a discovered sitemap."""
     url: str
@@ -2,16 +2,15 @@
 AI-powered CSV processor for Pep-Pedia scraped data.
 """
 
-import sys
+import asyncio
+import hashlib
 import os
 import json
-import pandas as pd
-from datetime import datetime
+import time
+from typing import List
 
-# Import from parent directory
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'utils'))
-from content_categorizer import ContentCategorizer
+from ..config import Config
+from ..utils.content_categorizer import ContentCategorizer
 
 
 class PepPediaAIProcessor:
@@ -20,6 +19,8 @@ class PepPediaAIProcessor:
     def __init__(self, openai_api_key: str = None):
         """Initialize the AI processor."""
         self.categorizer = ContentCategorizer(openai_api_key) if openai_api_key else None
+        # AI results keyed by a digest of the route content they were produced from
+        self._cache = {}
         
     def process_csv_with_ai(self, input_csv_path: str, output_csv_path: str) -> bool:
         """Process raw CSV with AI to fill categorized columns."""
@@ -31,6 +32,9 @@ class PepPediaAIProcessor:
             print("❌ No OpenAI API key provided")
             return False
         
+        # Imported here so scripts that never run the AI step skip loading pandas
+        import pandas as pd
+        
         try:
             # Read the raw CSV
             print(f"📄 Reading raw CSV: {input_csv_path}")
@@ -47,10 +51,18 @@ class PepPediaAIProcessor:
                 'Storage', 'Cycle Length', 'Break Between'
             ]
             
+            # Category columns left empty in the raw CSV are read as floats; let them hold text
+            for col in category_columns:
+                if col in df.columns:
+                    df[col] = df[col].astype(object)
+            
             # Process each row
-            processed_rows = []
+            pending_rows = []
+            pending_positions = []
             
-            for idx, row in df.iterrows():
+            # Read rows as plain dicts rather than boxing each into a pandas Series;
+            # results are written back into df, whose RangeIndex matches idx
+            for idx, row in enumerate(df.to_dict('records')):
                 peptide_name = row.get('peptide_name', 'Unknown')
                 route = row.get('route', 'unknown')
                 print(f"\n🧪 Processing row {idx + 1}/{len(df)}: {peptide_name} ({route})")
@@ -59,45 +71,38 @@ class PepPediaAIProcessor:
                 route_content = row.get('route_content', '')
                 if pd.isna(route_content) or not route_content:
                     print("⚠️  No route content found, skipping...")
-                    processed_rows.append(row)
-                    continue
+                else:
+                    pending_rows.append(row)
+                    pending_positions.append(idx)
+            
+            # Use AI to categorize the content, several rows at a time
+            if pending_rows:
+                print(f"\n🤖 Using AI to categorize {len(pending_rows)} rows ({Config.AI_CONCURRENCY} at a time)...")
+                results = asyncio.run(self._categorize_rows(pending_rows, Config.AI_CONCURRENCY))
                 
-                # Use AI to categorize the content
-                try:
-                    print("🤖 Using AI to categorize content...")
+                failed = 0
+                for idx, row, categorized_data in zip(pending_positions, pending_rows, results):
+                    if isinstance(categorized_data, Exception):
+                        print(f"⚠️  AI categorization failed for {row.get('peptide_name', 'Unknown')}: {categorized_data}")
+                        # Keep original values if AI fails
+                        failed += 1
+                        continue
                     
-                    categorized_data = self.categorizer.categorize_content(
-                        title=f"{peptide_name} - {route}",
-                        content=route_content,
-                        url=row.get('source_url', '')
-                    )
-                    
-                    # Fill the categorized columns
+                    # Fill the categorized columns in place
                     for col in category_columns:
-                        if col in categorized_data:
-                            row[col] = categorized_data[col]
-                        else:
-                            row[col] = ""
-                    
-                    print("✅ Content categorized successfully")
-                    
-                except Exception as e:
-                    print(f"⚠️  AI categorization failed: {e}")
-                    # Keep original values if AI fails
-                    pass
+                        df.at[idx, col] = categorized_data.get(col, "")
                 
-                processed_rows.append(row)
-            
-            # Create new DataFrame with processed data
-            processed_df = pd.DataFrame(processed_rows)
+                categorized = len(results) - failed
+                if failed:
+                    print(f"⚠️  {categorized} categorized, {failed} failed")
+                else:
+                    print(f"✅ Content categorized successfully ({categorized} rows)")
             
             # Save the enhanced CSV
             print(f"\n💾 Saving enhanced CSV: {output_csv_path}")
-            processed_df.to_csv(output_csv_path, index=False)
+            df.to_csv(output_csv_path, index=False)
             
-            print(f"✅ Enhanced CSV saved with {len(processed_df)} rows")
-            print(f"📊 Original CSV length: {len(df)} rows")
-            print(f"📊 Enhanced CSV length: {len(processed_df)} rows")
+            print(f"✅ Enhanced CSV saved with {len(df)} rows")
             
             return True
             
@@ -107,6 +112,52 @@ class PepPediaAIProcessor:
             traceback.print_exc()
             return False
     
+    async def _categorize_rows(self, rows: List[dict], concurrency: int) -> List:
+        """Categorize rows concurrently, returning results (or exceptions) in order.
+        
+        Rows whose route content was already categorized, in this run or an
+        earlier one on the same processor, reuse that result instead of
+        making another AI call.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def categorize(row: dict):
+            async with semaphore:
+                # The OpenAI client is blocking; each call waits on the network in a worker thread
+                return await asyncio.to_thread(
+                    self.categorizer.categorize_content,
+                    title=f"{row.get('peptide_name', 'Unknown')} - {row.get('route', 'unknown')}",
+                    content=row.get('route_content', ''),
+                    url=row.get('source_url', '')
+                )
+        
+        keys = [self._content_key(row.get('route_content', '')) for row in rows]
+        
+        # One request per distinct uncached content; the first row carrying it supplies the title
+        to_fetch = {}
+        for key, row in zip(keys, rows):
+            if key not in self._cache and key not in to_fetch:
+                to_fetch[key] = row
+        
+        if len(to_fetch) < len(rows):
+            print(f"♻️  Reusing cached results for {len(rows) - len(to_fetch)} rows")
+        
+        results = await asyncio.gather(*(categorize(row) for row in to_fetch.values()), return_exceptions=True)
+        
+        failures = {}
+        for key, result in zip(to_fetch, results):
+            if isinstance(result, Exception):
+                failures[key] = result
+            else:
+                self._cache[key] = result
+        
+        return [failures[key] if key in failures else self._cache[key] for key in keys]
+    
+    @staticmethod
+    def _content_key(content) -> str:
+        """Short digest identifying a piece of route content."""
+        return hashlib.blake2b(str(content).encode('utf-8'), digest_size=16).hexdigest()
+    
     def process_latest_csv(self, output_dir: str = ".") -> str:
         """Process the latest CSV file and return the enhanced CSV path."""
         
@@ -126,7 +177,7 @@ class PepPediaAIProcessor:
         print(f"📄 Found latest CSV: {latest_csv}")
         
         # Generate output filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         output_csv = os.path.join(output_dir, f"pep_pedia_enhanced_{timestamp}.csv")
         
         # Process with AI
@@ -3,25 +3,137 @@ Base scraper class and common functionality.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Callable, List
+from typing import Optional, Dict, Any, Callable, List, Tuple
+import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedResponse, CachedSession
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from datetime import datetime
 
 from ..config import Config
 from ..models import ScrapedPage
-from ..utils import safe_request, delay_request
+from ..utils import safe_request, read_capped_body, extract_custom_data, extract_title_content_pairs, strip_boilerplate
+
+
+def parse_page_content(
+    content: bytes,
+    url: str,
+    selectors: Optional[Dict[str, str]] = None,
+    parser: str = Config.HTML_PARSER
+) -> Dict[str, Any]:
+    """Parse raw HTML bytes into page data.
+    
+    Kept at module level (and fed only bytes and small dicts) so batch scrapes
+    can ship it to worker processes cheaply.
+    """
+    soup = BeautifulSoup(content, parser)
+    
+    if selectors:
+        data = extract_custom_data(soup, selectors)
+    else:
+        # Selectors may target <script> (e.g. JSON-LD), so only strip for plain extraction
+        data = {'title_content_pairs': extract_title_content_pairs(strip_boilerplate(soup))}
+    
+    data['scraped_url'] = url
+    data['scraped_at'] = datetime.now().isoformat()
+    
+    return data
+
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the process pool shared by every batch scrape, starting it on first use.
+    
+    Workers are spawned rather than forked because the Streamlit server is
+    multi-threaded, and forking a threaded process can deadlock the child.
+    The pool lives for the whole process, across reruns, and is shut down at
+    interpreter exit with any queued parses cancelled.
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            atexit.register(_parse_pool.shutdown, cancel_futures=True)
+        return _parse_pool
+
+
+def _read_before_caching(response: requests.Response) -> bool:
+    """Read a fresh response's body under the download cap before requests-cache stores it.
+    
+    requests-cache would otherwise read the whole body itself, ahead of the
+    streaming cap. Oversized bodies raise ``ResponseTooLarge`` out of the
+    request instead of being cached; everything else, sized or chunked, is kept.
+    """
+    if not isinstance(response, CachedResponse):
+        read_capped_body(response)
+    return True
+
+
+def create_session(cache: bool = Config.HTTP_CACHE_ENABLED) -> requests.Session:
+    """Build a pooled, retrying HTTP session that scrapers can share."""
+    if cache:
+        # Re-runs replay unchanged pages from disk, honouring ETag/Cache-Control
+        session = CachedSession(
+            Config.HTTP_CACHE_NAME,
+            backend='sqlite',
+            expire_after=Config.HTTP_CACHE_EXPIRE_SECONDS,
+            cache_control=True,
+            allowable_methods=('GET',),
+            filter_fn=_read_before_caching
+        )
+    else:
+        session = requests.Session()
+    session.headers.update({
+        'User-Agent': Config.USER_AGENT,
+        # Advertises br alongside gzip/deflate only when a brotli decoder is installed
+        'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
+    })
+    
+    # Keep sockets to the same host alive across requests and retry transient failures
+    adapter = HTTPAdapter(
+        pool_connections=Config.POOL_CONNECTIONS,
+        pool_maxsize=Config.POOL_CONNECTIONS,
+        max_retries=Retry(
+            total=Config.MAX_RETRIES,
+            backoff_factor=Config.RETRY_BACKOFF_FACTOR,
+            status_forcelist=Config.RETRY_STATUS_CODES
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
 
 class BaseScraper(ABC):
     """Base class for all scrapers."""
     
-    def __init__(self, delay: float = Config.DEFAULT_DELAY):
+    def __init__(
+        self,
+        delay: float = Config.DEFAULT_DELAY,
+        parser: str = Config.HTML_PARSER,
+        cache: bool = Config.HTTP_CACHE_ENABLED,
+        session: Optional[requests.Session] = None
+    ):
         self.delay = delay
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': Config.USER_AGENT
-        })
+        self.parser = parser
+        # A session passed in is shared with other scrapers and closed by its owner
+        self._owns_session = session is None
+        self.session = session if session is not None else create_session(cache)
     
     @abstractmethod
     def scrape(self, url: str, **kwargs) -> Optional[ScrapedPage]:
@@ -37,28 +149,11 @@ class BaseScraper(ABC):
         if not response:
             return {}
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        data = {}
-        
-        if selectors:
-            data = self._extract_custom_data(soup, selectors)
-        else:
-            data = self._extract_title_content(soup)
-        
-        data['scraped_url'] = response.url
-        data['scraped_at'] = datetime.now().isoformat()
-        
-        return data
-    
-    def _extract_custom_data(self, soup: BeautifulSoup, selectors: Dict[str, str]) -> Dict[str, Any]:
-        """Extract data using custom CSS selectors."""
-        from ..utils import extract_custom_data
-        return extract_custom_data(soup, selectors)
+        return self.parse_html(response.content, response.url, selectors)
     
-    def _extract_title_content(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract title-content pairs from HTML."""
-        from ..utils import extract_title_content_pairs
-        return {'title_content_pairs': extract_title_content_pairs(soup)}
+    def parse_html(self, content: bytes, url: str, selectors: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Parse raw HTML bytes fetched from ``url``."""
+        return parse_page_content(content, url, selectors, self.parser)
     
     def scrape_single_page(self, url: str, selectors: Optional[Dict[str, str]] = None) -> Optional[ScrapedPage]:
         """Scrape a single page and return ScrapedPage object."""
@@ -69,7 +164,114 @@ class BaseScraper(ABC):
         data = self.parse_content(response, selectors)
         return ScrapedPage.from_dict(data)
     
+    def scrape_multiple_pages(
+        self,
+        urls: List[str],
+        selectors: Optional[Dict[str, str]] = None,
+        progress_callback: Optional[Callable] = None,
+        concurrency: int = Config.DEFAULT_CONCURRENCY,
+        use_processes: bool = Config.PARSE_IN_PROCESSES
+    ) -> List[ScrapedPage]:
+        """Scrape a list of URLs concurrently, preserving input order."""
+        if not urls:
+            return []
+        return asyncio.run(self.scrape_multiple_pages_async(
+            urls, selectors, progress_callback, concurrency, use_processes
+        ))
+    
+    async def scrape_multiple_pages_async(
+        self,
+        urls: List[str],
+        selectors: Optional[Dict[str, str]] = None,
+        progress_callback: Optional[Callable] = None,
+        concurrency: int = Config.DEFAULT_CONCURRENCY,
+        use_processes: bool = Config.PARSE_IN_PROCESSES
+    ) -> List[ScrapedPage]:
+        """Fetch pages over one pooled aiohttp session and parse them off the event loop.
+        
+        Parsing is CPU-bound and holds the GIL, so batches of at least
+        ``Config.PARSE_PROCESS_MIN_PAGES`` run in the shared process pool;
+        otherwise the default thread executor is used.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        completed = 0
+        total = len(urls)
+        loop = asyncio.get_running_loop()
+        use_pool = use_processes and total >= Config.PARSE_PROCESS_MIN_PAGES
+        parse_pool = _get_parse_pool() if use_pool else None
+        
+        async def scrape_one(session: aiohttp.ClientSession, url: str) -> Optional[ScrapedPage]:
+            nonlocal completed
+            fetched = await self._fetch_async(session, semaphore, url)
+            
+            completed += 1
+            if progress_callback:
+                progress = 0.5 + (completed / total) * 0.5
+                progress_callback(progress, f"Scraping page {completed}/{total}: {url}")
+            
+            if not fetched:
+                return None
+            
+            final_url, content = fetched
+            data = await loop.run_in_executor(
+                parse_pool, parse_page_content, content, final_url, selectors, self.parser
+            )
+            return ScrapedPage.from_dict(data)
+        
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        async with aiohttp.ClientSession(headers=dict(self.session.headers), connector=connector) as session:
+            pages = await asyncio.gather(*(scrape_one(session, url) for url in urls))
+        
+        return [page for page in pages if page]
+    
+    async def _fetch_async(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        url: str
+    ) -> Optional[Tuple[str, bytes]]:
+        """Fetch a webpage asynchronously, returning its final URL and body.
+        
+        Connection errors, timeouts and ``Config.RETRY_STATUS_CODES`` are
+        retried with exponential backoff, matching the requests session's Retry.
+        Unlike ``get_page`` this path does not read or fill the on-disk HTTP cache.
+        """
+        async with semaphore:
+            try:
+                for attempt in range(Config.MAX_RETRIES + 1):
+                    if attempt:
+                        await asyncio.sleep(Config.RETRY_BACKOFF_FACTOR * 2 ** (attempt - 1))
+                    
+                    try:
+                        async with session.get(url, timeout=aiohttp.ClientTimeout(total=Config.TIMEOUT)) as response:
+                            if response.status in Config.RETRY_STATUS_CODES and attempt < Config.MAX_RETRIES:
+                                continue
+                            response.raise_for_status()
+                            
+                            if response.content_length and response.content_length > Config.MAX_RESPONSE_BYTES:
+                                return None
+                            
+                            chunks = []
+                            received = 0
+                            async for chunk in response.content.iter_chunked(Config.STREAM_CHUNK_SIZE):
+                                received += len(chunk)
+                                if received > Config.MAX_RESPONSE_BYTES:
+                                    return None
+                                chunks.append(chunk)
+                            
+                            return str(response.url), b''.join(chunks)
+                    except aiohttp.ClientResponseError:
+                        return None
+                    except (aiohttp.ClientError, asyncio.TimeoutError):
+                        if attempt == Config.MAX_RETRIES:
+                            return None
+                return None
+            finally:
+                # Hold the slot for the politeness delay before the next request
+                if self.delay > 0:
+                    await asyncio.sleep(self.delay)
+    
     def __del__(self):
         """Cleanup session when scraper is destroyed."""
-        if hasattr(self, 'session'):
+        if hasattr(self, 'session') and getattr(self, '_owns_session', True):
             self.session.close()
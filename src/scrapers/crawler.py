@@ -2,30 +2,52 @@
 Website crawler for discovering and scraping multiple pages.
 """
 
-from collections import deque
-from typing import List, Optional, Dict, Callable
+import re
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Callable, Pattern, Set, Union
 from urllib.parse import urlparse
+import requests
 from bs4 import BeautifulSoup
 
-from ..config import Config
+from ..config import Config, compile_exclude_patterns
 from ..models import ScrapedPage
-from ..utils import extract_links, is_internal_link, should_skip_url, delay_request, extract_title_content_pairs, normalize_url, extract_custom_data
+from ..utils import extract_links, is_internal_link, should_skip_url, delay_request, extract_title_content_pairs, normalize_url, extract_custom_data, strip_boilerplate
 from .base import BaseScraper
 
 
 class WebsiteCrawler(BaseScraper):
     """Crawler for discovering and scraping entire websites."""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Worker threads share these, so one host never sees more than
+        # PER_HOST_CONCURRENCY requests per delay window however large the pool
+        self._host_slots = defaultdict(lambda: threading.Semaphore(Config.PER_HOST_CONCURRENCY))
+        self._host_slots_lock = threading.Lock()
+    
+    def get_page(self, url: str) -> Optional[requests.Response]:
+        """Fetch a page while holding one of its host's slots through the politeness delay."""
+        with self._host_slots_lock:
+            slot = self._host_slots[urlparse(url).netloc]
+        with slot:
+            try:
+                return super().get_page(url)
+            finally:
+                delay_request(self.delay)
+    
     def scrape(
         self, 
         start_url: str, 
         max_pages: int = Config.DEFAULT_MAX_PAGES,
         max_depth: int = Config.DEFAULT_MAX_DEPTH,
         stay_on_domain: bool = True,
-        exclude_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[Union[Pattern, List[str]]] = None,
         use_sitemap: bool = True,
         selectors: Optional[Dict[str, str]] = None,
         progress_callback: Optional[Callable] = None,
+        concurrency: int = Config.DEFAULT_CONCURRENCY,
         **kwargs
     ) -> List[ScrapedPage]:
         """Scrape entire website starting from a URL."""
@@ -33,7 +55,7 @@ class WebsiteCrawler(BaseScraper):
         # Try sitemap first if enabled
         if use_sitemap:
             from .sitemap import SitemapScraper
-            sitemap_scraper = SitemapScraper(delay=self.delay)
+            sitemap_scraper = SitemapScraper(delay=self.delay, session=self.session)
             
             if progress_callback:
                 progress_callback(0.05, "Attempting to discover sitemap...")
@@ -43,7 +65,7 @@ class WebsiteCrawler(BaseScraper):
                 urls_to_scrape = sitemap_urls[:max_pages]
                 if progress_callback:
                     progress_callback(0.5, f"Found {len(urls_to_scrape)} URLs from sitemap")
-                return self._scrape_urls(urls_to_scrape, selectors, progress_callback)
+                return self._scrape_urls(urls_to_scrape, selectors, progress_callback, concurrency)
         
         # Fallback to crawling if no sitemap found
         if progress_callback:
@@ -51,11 +73,11 @@ class WebsiteCrawler(BaseScraper):
         
         urls_to_scrape = self._discover_pages(
             start_url, max_pages, max_depth, stay_on_domain, 
-            exclude_patterns or Config.DEFAULT_EXCLUDE_PATTERNS, 
-            progress_callback
+            exclude_patterns or Config.DEFAULT_EXCLUDE_RE, 
+            progress_callback, concurrency
         )
         
-        return self._scrape_urls(urls_to_scrape, selectors, progress_callback)
+        return self._scrape_urls(urls_to_scrape, selectors, progress_callback, concurrency)
     
     def _discover_pages(
         self, 
@@ -63,76 +85,107 @@ class WebsiteCrawler(BaseScraper):
         max_pages: int, 
         max_depth: int,
         stay_on_domain: bool,
-        exclude_patterns: List[str],
-        progress_callback: Optional[Callable] = None
+        exclude_patterns: Union[Pattern, List[str]],
+        progress_callback: Optional[Callable] = None,
+        concurrency: int = Config.DEFAULT_CONCURRENCY
     ) -> List[str]:
-        """Discover pages using breadth-first search."""
-        base_domain = urlparse(start_url).netloc
+        """Discover pages using breadth-first search.
+        
+        The queue is drained in batches of up to ``concurrency`` URLs that are
+        fetched in parallel; results are handled in queue order, so links are
+        enqueued exactly as a one-at-a-time crawl would enqueue them.
+        """
+        if not isinstance(exclude_patterns, re.Pattern):
+            exclude_patterns = compile_exclude_patterns(exclude_patterns)
+        
         visited = set()
         queue = deque([(start_url, 0)])  # (url, depth)
         discovered_urls = set()
-        
-        while queue and len(discovered_urls) < max_pages:
-            current_url, depth = queue.popleft()
-            
-            if current_url in visited or depth > max_depth:
-                continue
-            
-            visited.add(current_url)
-            
-            # Skip URLs based on patterns
-            if should_skip_url(current_url, exclude_patterns):
-                continue
-            
-            if progress_callback:
-                progress = min(len(discovered_urls) / max_pages, 0.95)
-                progress_callback(progress, f"Discovering: {current_url} (depth: {depth}, found: {len(discovered_urls)} pages)")
-            
-            response = self.get_page(current_url)
-            if response:
-                discovered_urls.add(current_url)
-                
-                # Extract links and add to queue
-                soup = BeautifulSoup(response.content, 'html.parser')
-                links = extract_links(soup, current_url)
+        max_workers = max(1, min(concurrency, Config.POOL_CONNECTIONS))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while queue and len(discovered_urls) < max_pages:
+                # Never fetch more pages than are still needed
+                batch = []
+                batch_size = min(max_workers, max_pages - len(discovered_urls))
+                while queue and len(batch) < batch_size:
+                    current_url, depth = queue.popleft()
+                    
+                    if current_url in visited or depth > max_depth:
+                        continue
+                    
+                    visited.add(current_url)
+                    
+                    # Skip URLs based on patterns
+                    if should_skip_url(current_url, exclude_patterns):
+                        continue
+                    
+                    if progress_callback:
+                        progress = min(len(discovered_urls) / max_pages, 0.95)
+                        progress_callback(progress, f"Discovering: {current_url} (depth: {depth}, found: {len(discovered_urls)} pages)")
+                    
+                    batch.append((current_url, depth))
                 
-                for link in links:
-                    if link not in visited:
-                        # Stay on same domain if required
-                        if stay_on_domain and not is_internal_link(link, start_url):
-                            continue
-                        
-                        queue.append((link, depth + 1))
-            
-            delay_request(self.delay)
+                fetched = executor.map(self._fetch_links, [url for url, _ in batch])
+                for (current_url, depth), links in zip(batch, fetched):
+                    if links is None:
+                        continue
+                    
+                    discovered_urls.add(current_url)
+                    
+                    # Add extracted links to the queue
+                    for link in links:
+                        if link not in visited:
+                            # Stay on same domain if required
+                            if stay_on_domain and not is_internal_link(link, start_url):
+                                continue
+                            
+                            queue.append((link, depth + 1))
         
         return list(discovered_urls)
     
+    def _fetch_links(self, url: str) -> Optional[Set[str]]:
+        """Fetch a page and return its links (None if it failed)."""
+        response = self.get_page(url)
+        if not response:
+            return None
+        
+        soup = BeautifulSoup(response.content, self.parser)
+        return extract_links(soup, url)
+    
     def _scrape_urls(
         self, 
         urls: List[str], 
         selectors: Optional[Dict[str, str]],
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        concurrency: int = Config.DEFAULT_CONCURRENCY
     ) -> List[ScrapedPage]:
-        """Scrape a list of URLs and extract backlinks."""
-        results = []
-        
+        """Scrape a list of URLs concurrently and extract backlinks."""
         if progress_callback:
             progress_callback(0.5, f"Found {len(urls)} pages. Starting scraping...")
         
-        for i, url in enumerate(urls, 1):
-            if progress_callback:
-                progress = 0.5 + (i / len(urls)) * 0.5
-                progress_callback(progress, f"Scraping page {i}/{len(urls)}: {url}")
-            
-            page_data = self.scrape_single_page_with_backlinks(url, selectors)
-            if page_data:
-                results.append(page_data)
-            
-            if i < len(urls):
-                delay_request(self.delay)
+        if not urls:
+            return []
+        
+        # Page fetches are network-bound; never run more workers than pooled sockets
+        max_workers = max(1, min(concurrency, Config.POOL_CONNECTIONS, len(urls)))
+        pages: List[Optional[ScrapedPage]] = [None] * len(urls)
+        
+        # Progress is reported from this thread only; workers just fetch and parse
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.scrape_single_page_with_backlinks, url, selectors): index
+                for index, url in enumerate(urls)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                pages[index] = future.result()
+                
+                if progress_callback:
+                    progress = 0.5 + (done / len(urls)) * 0.5
+                    progress_callback(progress, f"Scraped page {done}/{len(urls)}: {urls[index]}")
         
-        return results
+        return [page for page in pages if page]
     
     def scrape_single_page_with_backlinks(self, url: str, selectors: Optional[Dict[str, str]] = None) -> Optional[ScrapedPage]:
         """Scrape a single page and extract backlink information."""
@@ -140,10 +193,7 @@ class WebsiteCrawler(BaseScraper):
         if not response:
             return None
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Extract basic content
-        title_content_pairs = extract_title_content_pairs(soup)
+        soup = BeautifulSoup(response.content, self.parser)
         
         # Extract custom data if selectors provided
         custom_data = {}
@@ -154,6 +204,10 @@ class WebsiteCrawler(BaseScraper):
         backlinks = self._extract_backlinks(soup, url)
         custom_data['backlinks'] = backlinks
         
+        # Extract basic content; boilerplate is stripped only now, since
+        # selectors may target <script> and links may sit inside <noscript>
+        title_content_pairs = extract_title_content_pairs(strip_boilerplate(soup))
+        
         # Create ScrapedPage
         page_data = {
             'scraped_url': response.url,
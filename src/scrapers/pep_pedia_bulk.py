@@ -3,17 +3,12 @@ Specialized scrapers for specific peptide websites.
 """
 
 from typing import Dict, List, Optional, Callable
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 import re
 from datetime import datetime
 import os
 import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import requests
 
 from .base import BaseScraper
 from ..models import ScrapedPage
@@ -89,15 +84,19 @@ class PepPediaBulkScraper(BaseScraper):
         "Wolverine Stack"
     ]
     
-    def __init__(self, delay: float = 1.0):
-        super().__init__(delay)
+    def __init__(self, delay: float = 1.0, session: Optional[requests.Session] = None):
+        super().__init__(delay, session=session)
         self.driver = None
     
     def _init_driver(self):
         """Initialize Selenium WebDriver with headless Chrome."""
         if self.driver:
             return self.driver
-            
+        
+        # Selenium is only imported once a browser is actually needed
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
@@ -114,13 +113,34 @@ class PepPediaBulkScraper(BaseScraper):
             # Fallback to requests-based scraping
             return None
     
-    def __del__(self):
-        """Cleanup WebDriver when scraper is destroyed."""
-        if hasattr(self, 'driver') and self.driver:
+    def _wait_for_body(self, driver, timeout: int):
+        """Block until the page body is present."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+    
+    def close(self):
+        """Quit the browser; the next toggle scrape starts a fresh one."""
+        if getattr(self, 'driver', None):
             try:
                 self.driver.quit()
             except:
                 pass
+            self.driver = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        """Cleanup WebDriver when scraper is destroyed."""
+        self.close()
         super().__del__()
     
     def scrape(self, url: str, **kwargs) -> Optional[ScrapedPage]:
@@ -134,7 +154,7 @@ class PepPediaBulkScraper(BaseScraper):
         if not response:
             return None
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, self.parser)
         
         # Extract content by route (oral/injectable)
         route_content = self._extract_by_route(soup)
@@ -144,7 +164,7 @@ class PepPediaBulkScraper(BaseScraper):
         for route, content in route_content.items():
             route_soup = BeautifulSoup(
                 "".join([c["content"] for c in content]),
-                "html.parser"
+                self.parser
             )
             peptide_info[route] = self._extract_peptide_info(route_soup)
         
@@ -188,13 +208,14 @@ class PepPediaBulkScraper(BaseScraper):
             return self.scrape(url, **kwargs)
         
         try:
+            # The browser is reused across peptides; start each page from a clean session
+            driver.delete_all_cookies()
+            
             print(f"🌐 Loading page: {url}")
             driver.get(url)
             
             # Wait for page to fully load
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            self._wait_for_body(driver, 15)
             time.sleep(3)  # Additional wait for dynamic content
             
             route_content = {}
@@ -205,7 +226,7 @@ class PepPediaBulkScraper(BaseScraper):
             # Step 1: Get initial content (detect what's currently active)
             print("📄 Extracting initial content...")
             initial_source = driver.page_source
-            initial_soup = BeautifulSoup(initial_source, 'html.parser')
+            initial_soup = BeautifulSoup(initial_source, self.parser)
             initial_content = self._extract_title_content_pairs(initial_soup)
             
             # Step 2: Detect what type of content this is
@@ -235,7 +256,7 @@ class PepPediaBulkScraper(BaseScraper):
                     print(f"✅ Toggle successful, extracting {target_route} content...")
                     
                     alternate_source = driver.page_source
-                    alternate_soup = BeautifulSoup(alternate_source, 'html.parser')
+                    alternate_soup = BeautifulSoup(alternate_source, self.parser)
                     alternate_content = self._extract_title_content_pairs(alternate_soup)
                     
                     # Check if content actually changed
@@ -273,7 +294,7 @@ class PepPediaBulkScraper(BaseScraper):
                 if content:
                     route_soup = BeautifulSoup(
                         "".join([c["content"] for c in content]),
-                        "html.parser"
+                        self.parser
                     )
                     peptide_info[route] = self._extract_peptide_info(route_soup)
                     print(f"🧪 Extracted peptide info for {route} route")
@@ -308,9 +329,7 @@ class PepPediaBulkScraper(BaseScraper):
         """Try to toggle to the specified route (oral/injectable/nasal/topical) with enhanced detection."""
         try:
             # Wait for page to be fully loaded
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            self._wait_for_body(driver, 10)
             
             # Multiple strategies to find toggle elements for all routes
             toggle_selectors = [
@@ -570,33 +589,36 @@ class PepPediaBulkScraper(BaseScraper):
         if peptide_name:
             info['name'] = peptide_name
         
+        # Collect section headings once; every section extractor scans the same list
+        section_headings = soup.find_all(['h2', 'h3', 'h4'])
+        
         # Extract molecular information
-        molecular_info = self._extract_molecular_info(soup)
+        molecular_info = self._extract_molecular_info(section_headings)
         if molecular_info:
             info['molecular_info'] = molecular_info
         
         # Extract benefits
-        benefits = self._extract_benefits(soup)
+        benefits = self._extract_benefits(section_headings)
         if benefits:
             info['benefits'] = benefits
         
         # Extract mechanism of action
-        mechanism = self._extract_mechanism(soup)
+        mechanism = self._extract_mechanism(section_headings)
         if mechanism:
             info['mechanism_of_action'] = mechanism
         
         # Extract research indications
-        indications = self._extract_research_indications(soup)
+        indications = self._extract_research_indications(section_headings)
         if indications:
             info['research_indications'] = indications
         
         # Extract quality indicators
-        quality = self._extract_quality_indicators(soup)
+        quality = self._extract_quality_indicators(section_headings)
         if quality:
             info['quality_indicators'] = quality
         
         # Extract research protocols
-        protocols = self._extract_protocols(soup)
+        protocols = self._extract_protocols(section_headings)
         if protocols:
             info['protocols'] = protocols
         
@@ -614,13 +636,12 @@ class PepPediaBulkScraper(BaseScraper):
             return text.strip()
         return None
     
-    def _extract_molecular_info(self, soup: BeautifulSoup) -> Optional[Dict]:
+    def _extract_molecular_info(self, section_headings: List[Tag]) -> Optional[Dict]:
         """Extract molecular information."""
         molecular_info = {}
         
         # Look for molecular information section
-        headings = soup.find_all(['h2', 'h3', 'h4'])
-        for heading in headings:
+        for heading in section_headings:
             if 'molecular' in heading.get_text().lower():
                 # Get next sibling elements
                 next_elem = heading.next_sibling
@@ -642,13 +663,12 @@ class PepPediaBulkScraper(BaseScraper):
         
         return molecular_info if molecular_info else None
     
-    def _extract_benefits(self, soup: BeautifulSoup) -> Optional[List[str]]:
+    def _extract_benefits(self, section_headings: List[Tag]) -> Optional[List[str]]:
         """Extract benefits information."""
         benefits = []
         
         # Look for benefits section
-        headings = soup.find_all(['h2', 'h3', 'h4'])
-        for heading in headings:
+        for heading in section_headings:
             if any(keyword in heading.get_text().lower() for keyword in ['benefit', 'advantage', 'effect']):
                 # Get list items or paragraphs
                 next_elem = heading.next_sibling
@@ -665,11 +685,10 @@ class PepPediaBulkScraper(BaseScraper):
         
         return benefits if benefits else None
     
-    def _extract_mechanism(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_mechanism(self, section_headings: List[Tag]) -> Optional[str]:
         """Extract mechanism of action."""
         # Look for mechanism section
-        headings = soup.find_all(['h2', 'h3', 'h4'])
-        for heading in headings:
+        for heading in section_headings:
             if any(keyword in heading.get_text().lower() for keyword in ['mechanism', 'action', 'how it works']):
                 # Get next sibling elements
                 next_elem = heading.next_sibling
@@ -684,13 +703,12 @@ class PepPediaBulkScraper(BaseScraper):
         
         return None
     
-    def _extract_research_indications(self, soup: BeautifulSoup) -> Optional[List[str]]:
+    def _extract_research_indications(self, section_headings: List[Tag]) -> Optional[List[str]]:
         """Extract research indications."""
         indications = []
         
         # Look for research/indications section
-        headings = soup.find_all(['h2', 'h3', 'h4'])
-        for heading in headings:
+        for heading in section_headings:
             if any(keyword in heading.get_text().lower() for keyword in ['research', 'indication', 'study', 'clinical']):
                 # Get list items or paragraphs
                 next_elem = heading.next_sibling
@@ -707,13 +725,12 @@ class PepPediaBulkScraper(BaseScraper):
         
         return indications if indications else None
     
-    def _extract_quality_indicators(self, soup: BeautifulSoup) -> Optional[Dict]:
+    def _extract_quality_indicators(self, section_headings: List[Tag]) -> Optional[Dict]:
         """Extract quality indicators."""
         quality = {}
         
         # Look for quality/purity information
-        headings = soup.find_all(['h2', 'h3', 'h4'])
-        for heading in headings:
+        for heading in section_headings:
             if any(keyword in heading.get_text().lower() for keyword in ['quality', 'purity', 'grade']):
                 # Get next sibling elements
                 next_elem = heading.next_sibling
@@ -735,13 +752,12 @@ class PepPediaBulkScraper(BaseScraper):
         
         return quality if quality else None
     
-    def _extract_protocols(self, soup: BeautifulSoup) -> Optional[List[Dict]]:
+    def _extract_protocols(self, section_headings: List[Tag]) -> Optional[List[Dict]]:
         """Extract research protocols."""
         protocols = []
         
         # Look for protocol/dosing section
-        headings = soup.find_all(['h2', 'h3', 'h4'])
-        for heading in headings:
+        for heading in section_headings:
             if any(keyword in heading.get_text().lower() for keyword in ['protocol', 'dosing', 'dosage', 'administration']):
                 # Get next sibling elements
                 next_elem = heading.next_sibling
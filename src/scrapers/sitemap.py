@@ -2,19 +2,47 @@
 Sitemap scraper for XML sitemap parsing and scraping.
 """
 
-from typing import List, Optional, Callable
+from io import BytesIO
+from typing import Iterator, List, Optional, Callable, Tuple
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
+import requests
+from lxml import etree
 
 from ..config import Config
 from ..models import ScrapedPage
-from ..utils import delay_request
+from ..utils import fetch_capped, ResponseTooLarge, TTLCache
 from .base import BaseScraper
 
 
+def iter_sitemap_locs(content: bytes) -> Iterator[Tuple[str, str]]:
+    """Stream ``(kind, loc)`` pairs out of sitemap XML.
+    
+    ``kind`` is ``'url'`` for page entries and ``'sitemap'`` for nested
+    sitemaps in an index. Each entry is cleared once read, so memory stays
+    flat no matter how large the sitemap is.
+    """
+    for _, elem in etree.iterparse(
+        BytesIO(content), events=('end',), tag=('{*}url', '{*}sitemap'), recover=True
+    ):
+        loc = elem.findtext('{*}loc')
+        if loc and loc.strip():
+            yield etree.QName(elem).localname, loc.strip()
+        
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+_NOT_PROBED = object()
+
+
 class SitemapScraper(BaseScraper):
     """Scraper for XML sitemaps."""
     
+    # host -> working sitemap URL, or None once every location was a definite
+    # miss; shared by every instance since the crawler builds one per run
+    _probed_sitemaps = TTLCache(Config.SITEMAP_PROBE_TTL_SECONDS, Config.SITEMAP_PROBE_MAX_ENTRIES)
+    
     def scrape(
         self,
         url: str,
@@ -45,75 +73,85 @@ class SitemapScraper(BaseScraper):
         urls_to_scrape = urls_to_scrape[:max_pages]
         
         # Scrape all URLs from sitemap
-        results = []
-        for i, sitemap_url in enumerate(urls_to_scrape, 1):
-            if progress_callback:
-                progress = 0.5 + (i / len(urls_to_scrape)) * 0.5
-                progress_callback(progress, f"Scraping page {i}/{len(urls_to_scrape)}: {sitemap_url}")
-            
-            page_data = self.scrape_single_page(sitemap_url, selectors)
-            if page_data:
-                results.append(page_data)
-            
-            if i < len(urls_to_scrape):
-                delay_request(self.delay)
-        
-        return results
+        return self.scrape_multiple_pages(urls_to_scrape, selectors, progress_callback)
     
     def parse_sitemap(self, sitemap_url: str, progress_callback: Optional[Callable] = None) -> List[str]:
         """Parse XML sitemap and extract all URLs."""
+        return self._parse_sitemap(sitemap_url, progress_callback) or []
+    
+    def _parse_sitemap(self, sitemap_url: str, progress_callback: Optional[Callable] = None) -> Optional[List[str]]:
+        """Parse a sitemap, returning None when the failure may be transient.
+        
+        An empty list means the sitemap is definitely unusable: missing (4xx),
+        oversized, or without any entries.
+        """
         try:
             if progress_callback:
                 progress_callback(0.1, f"Fetching sitemap: {sitemap_url}")
             
-            response = self.get_page(sitemap_url)
-            if not response:
+            try:
+                response = fetch_capped(sitemap_url, self.session, max_bytes=Config.SITEMAP_MAX_BYTES)
+            except ResponseTooLarge as e:
+                if progress_callback:
+                    progress_callback(0, f"Skipping sitemap: {e}")
                 return []
+            except requests.exceptions.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status is not None and 400 <= status < 500 and status not in (408, 429):
+                    return []
+                return None
+            except requests.exceptions.RequestException:
+                return None
             
             if progress_callback:
                 progress_callback(0.3, "Parsing sitemap XML...")
             
-            soup = BeautifulSoup(response.content, 'xml')
             urls = []
-            
-            # Find all URL elements
-            url_elements = soup.find_all('url')
+            nested_sitemaps = []
+            for kind, loc in iter_sitemap_locs(response.content):
+                if kind == 'url':
+                    urls.append(loc)
+                else:
+                    nested_sitemaps.append(loc)
             
             if progress_callback:
-                progress_callback(0.5, f"Found {len(url_elements)} URLs in sitemap")
-            
-            for url_elem in url_elements:
-                loc_elem = url_elem.find('loc')
-                if loc_elem and loc_elem.text:
-                    urls.append(loc_elem.text.strip())
+                progress_callback(0.5, f"Found {len(urls)} URLs in sitemap")
             
-            # Also check for sitemap index (nested sitemaps)
-            sitemap_elements = soup.find_all('sitemap')
-            if sitemap_elements:
+            # Also follow sitemap index entries (nested sitemaps)
+            if nested_sitemaps:
                 if progress_callback:
-                    progress_callback(0.7, f"Found {len(sitemap_elements)} nested sitemaps, processing...")
+                    progress_callback(0.7, f"Found {len(nested_sitemaps)} nested sitemaps, processing...")
                 
-                for sitemap_elem in sitemap_elements:
-                    loc_elem = sitemap_elem.find('loc')
-                    if loc_elem and loc_elem.text:
-                        nested_urls = self.parse_sitemap(loc_elem.text.strip(), progress_callback)
-                        urls.extend(nested_urls)
+                for nested_sitemap_url in nested_sitemaps:
+                    urls.extend(self.parse_sitemap(nested_sitemap_url, progress_callback))
             
             if progress_callback:
                 progress_callback(1.0, f"Successfully parsed {len(urls)} URLs from sitemap")
             
-            return list(set(urls))  # Remove duplicates
+            return list(dict.fromkeys(urls))  # Remove duplicates, keep sitemap order
             
         except Exception as e:
             if progress_callback:
                 progress_callback(0, f"Error parsing sitemap: {str(e)}")
-            return []
+            return None
     
     def discover_sitemap_urls(self, base_url: str, progress_callback: Optional[Callable] = None) -> List[str]:
         """Try to discover and parse sitemap URLs for a website."""
         parsed_url = urlparse(base_url)
         domain = parsed_url.netloc
         
+        # Reuse the last probe for this host instead of re-trying every location
+        known_sitemap_url = self._probed_sitemaps.get(domain, _NOT_PROBED)
+        if known_sitemap_url is not _NOT_PROBED:
+            if known_sitemap_url:
+                urls = self.parse_sitemap(known_sitemap_url, progress_callback)
+                if urls:
+                    return urls
+            else:
+                if progress_callback:
+                    progress_callback(0, "No sitemap found, falling back to crawling")
+                return []
+        
         # Common sitemap locations
         sitemap_urls = []
         for location in Config.SITEMAP_LOCATIONS:
@@ -122,13 +160,21 @@ class SitemapScraper(BaseScraper):
                 f"https://www.{domain}{location}"
             ])
         
+        transient_failure = False
         for sitemap_url in sitemap_urls:
             if progress_callback:
                 progress_callback(0.1, f"Trying sitemap: {sitemap_url}")
             
-            urls = self.parse_sitemap(sitemap_url, progress_callback)
+            urls = self._parse_sitemap(sitemap_url, progress_callback)
             if urls:
+                self._probed_sitemaps.set(domain, sitemap_url)
                 return urls
+            transient_failure = transient_failure or urls is None
+        
+        # A timeout or server error says nothing about the sitemap, so only
+        # remember the miss when every location definitely had none
+        if not transient_failure:
+            self._probed_sitemaps.set(domain, None)
         
         if progress_callback:
             progress_callback(0, "No sitemap found, falling back to crawling")
@@ -3,10 +3,11 @@ Specialized scrapers for specific peptide websites.
 """
 
 from typing import Dict, List, Optional, Callable
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 import re
 import json
 import os
+import requests
 
 from .base import BaseScraper
 from ..models import ScrapedPage
@@ -21,7 +22,7 @@ class PepPediaScraper(BaseScraper):
         if not response:
             return None
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, self.parser)
         
         # Extract structured data
         structured_data = self._extract_peptide_info(soup)
@@ -45,33 +46,36 @@ class PepPediaScraper(BaseScraper):
         if peptide_name:
             info['name'] = peptide_name
         
+        # Collect section headings once; every section extractor scans the same list
+        section_headings = soup.find_all(['h2', 'h3', 'h4'])
+        
         # Extract molecular information
-        molecular_info = self._extract_molecular_info(soup)
+        molecular_info = self._extract_molecular_info(section_headings)
         if molecular_info:
             info['molecular_info'] = molecular_info
         
         # Extract benefits
-        benefits = self._extract_benefits(soup)
+        benefits = self._extract_benefits(section_headings)
         if benefits:
             info['benefits'] = benefits
         
         # Extract mechanism of action
-        mechanism = self._extract_mechanism(soup)
+        mechanism = self._extract_mechanism(section_headings)
         if mechanism:
             info['mechanism_of_action'] = mechanism
         
         # Extract research indications
-        indications = self._extract_research_indications(soup)
+        indications = self._extract_research_indications(section_headings)
         if indications:
             info['research_indications'] = indications
         
         # Extract quality indicators
-        quality = self._extract_quality_indicators(soup)
+        quality = self._extract_quality_indicators(section_headings)
         if quality:
             info['quality_indicators'] = quality
         
         # Extract research protocols
-        protocols = self._extract_protocols(soup)
+        protocols = self._extract_protocols(section_headings)
         if protocols:
             info['protocols'] = protocols
         
@@ -89,13 +93,12 @@ class PepPediaScraper(BaseScraper):
             return text.strip()
         return None
     
-    def _extract_molecular_info(self, soup: BeautifulSoup) -> Optional[Dict]:
+    def _extract_molecular_info(self, section_headings: List[Tag]) -> Optional[Dict]:
         """Extract molecular information."""
         molecular_info = {}
         
         # Look for molecular information section
-        headings = soup.find_all(['h2', 'h3', 'h4'])
-        for heading in headings:
+        for heading in section_headings:
             if 'molecular' in heading.get_text().lower():
                 # Get next sibling elements
                 next_elem = heading.next_sibling
@@ -128,13 +131,12 @@ class PepPediaScraper(BaseScraper):
         
         return molecular_info if molecular_info else None
     
-    def _extract_benefits(self, soup: BeautifulSoup) -> Optional[List[str]]:
+    def _extract_benefits(self, section_headings: List[Tag]) -> Optional[List[str]]:
         """Extract key benefits."""
         benefits = []
         
         # Look for benefits section
-        headings = soup.find_all(['h2', 'h3', 'h4'])
-        for heading in headings:
+        for heading in section_headings:
             if 'benefit' in heading.get_text().lower():
                 # Get next sibling elements
                 next_elem = heading.next_sibling
@@ -148,10 +150,9 @@ class PepPediaScraper(BaseScraper):
         
         return benefits if benefits else None
     
-    def _extract_mechanism(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_mechanism(self, section_headings: List[Tag]) -> Optional[str]:
         """Extract mechanism of action."""
-        headings = soup.find_all(['h2', 'h3', 'h4'])
-        for heading in headings:
+        for heading in section_headings:
             if 'mechanism' in heading.get_text().lower():
                 next_elem = heading.next_sibling
                 mechanism_text = ""
@@ -167,12 +168,11 @@ class PepPediaScraper(BaseScraper):
         
         return None
     
-    def _extract_research_indications(self, soup: BeautifulSoup) -> Optional[List[Dict]]:
+    def _extract_research_indications(self, section_headings: List[Tag]) -> Optional[List[Dict]]:
         """Extract research indications."""
         indications = []
         
-        headings = soup.find_all(['h2', 'h3', 'h4'])
-        for heading in headings:
+        for heading in section_headings:
             if 'indication' in heading.get_text().lower() or 'effective' in heading.get_text().lower():
                 next_elem = heading.next_sibling
                 
@@ -189,12 +189,11 @@ class PepPediaScraper(BaseScraper):
         
         return indications if indications else None
     
-    def _extract_quality_indicators(self, soup: BeautifulSoup) -> Optional[List[Dict]]:
+    def _extract_quality_indicators(self, section_headings: List[Tag]) -> Optional[List[Dict]]:
         """Extract quality indicators."""
         indicators = []
         
-        headings = soup.find_all(['h2', 'h3', 'h4'])
-        for heading in headings:
+        for heading in section_headings:
             if 'quality' in heading.get_text().lower():
                 next_elem = heading.next_sibling
                 
@@ -211,13 +210,12 @@ class PepPediaScraper(BaseScraper):
         
         return indicators if indicators else None
     
-    def _extract_protocols(self, soup: BeautifulSoup) -> Optional[Dict]:
+    def _extract_protocols(self, section_headings: List[Tag]) -> Optional[Dict]:
         """Extract research protocols."""
         protocol_info = {}
         
         # Look for protocol sections
-        headings = soup.find_all(['h2', 'h3', 'h4'])
-        for heading in headings:
+        for heading in section_headings:
             heading_text = heading.get_text().lower()
             if any(keyword in heading_text for keyword in ['protocol', 'dose', 'reconstitute']):
                 next_elem = heading.next_sibling
@@ -243,7 +241,8 @@ class PepPediaScraper(BaseScraper):
         pairs = []
         
         # Get main title
-        main_title = soup.title.string.strip() if soup.title else ''
+        title_tag = soup.title
+        main_title = (title_tag.string or '').strip() if title_tag else ''
         if main_title:
             pairs.append({'title': main_title, 'content': ''})
         
@@ -365,8 +364,8 @@ class PeptiPricesScraper(BaseScraper):
         "IGF-1 DES"
     ]
     
-    def __init__(self, delay: float = 1.0):
-        super().__init__(delay)
+    def __init__(self, delay: float = 1.0, session: Optional[requests.Session] = None):
+        super().__init__(delay, session=session)
         self.dosage_data = self._load_dosage_data()
     
     def _load_dosage_data(self) -> Dict:
@@ -395,7 +394,7 @@ class PeptiPricesScraper(BaseScraper):
         if not response:
             return None
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, self.parser)
         
         # Extract product pricing data
         products = self._extract_product_data(soup)
@@ -445,7 +444,7 @@ class PeptiPricesScraper(BaseScraper):
                 # Scrape the URL
                 response = self.get_page(url)
                 if response:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    soup = BeautifulSoup(response.content, self.parser)
                     products = self._extract_product_data(soup)
                     
                     page_data = {
@@ -720,7 +719,8 @@ class PeptiPricesScraper(BaseScraper):
         pairs = []
         
         # Get main title
-        main_title = soup.title.string.strip() if soup.title else ''
+        title_tag = soup.title
+        main_title = (title_tag.string or '').strip() if title_tag else ''
         if main_title:
             pairs.append({'title': main_title, 'content': ''})
         
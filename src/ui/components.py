@@ -2,11 +2,15 @@
 UI components for the Streamlit application.
 """
 
+import re
 import streamlit as st
 from typing import Dict, Any, Tuple, Optional
 
 from ..config import Config, ScrapingMode, parse_exclude_patterns, parse_selectors
 
+# Scheme, a host and no whitespace: the common well-formed case, accepted without further checks
+URL_RE = re.compile(r'^https?://[^\s/$.?#][^\s]*$')
+
 
 class UIComponents:
     """UI component utilities for the Streamlit app."""
@@ -36,7 +40,7 @@ class UIComponents:
             # Scraping Mode
             scraping_mode = st.selectbox(
                 "Scraping Mode",
-                [ScrapingMode.BASIC, ScrapingMode.CUSTOM_SELECTORS, "PeptiPrices (Specialized)", "Pep-Pedia (Specialized)"]
+                [ScrapingMode.BASIC, ScrapingMode.CUSTOM_SELECTORS, ScrapingMode.PEPTI_PRICES, ScrapingMode.PEP_PEDIA]
             )
             
             # URL Input
@@ -51,9 +55,9 @@ class UIComponents:
             
             if scraping_mode == ScrapingMode.CUSTOM_SELECTORS:
                 config = UIComponents._render_custom_selectors_config()
-            elif scraping_mode == "PeptiPrices (Specialized)":
+            elif scraping_mode == ScrapingMode.PEPTI_PRICES:
                 config = UIComponents._render_pepti_prices_config()
-            elif scraping_mode == "Pep-Pedia (Specialized)":
+            elif scraping_mode == ScrapingMode.PEP_PEDIA:
                 config = UIComponents._render_pep_pedia_config()
             
             # Scrape Button
@@ -105,6 +109,9 @@ class UIComponents:
     @staticmethod
     def validate_url(url: str) -> bool:
         """Validate URL input."""
+        if url and URL_RE.match(url):
+            return True
+        
         if not url:
             st.error("⚠️ Please enter a URL to scrape!")
             return False
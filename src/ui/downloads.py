@@ -3,15 +3,23 @@ Download management for the Streamlit application.
 """
 
 import streamlit as st
-from typing import Union, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Union, List
 from datetime import datetime
 
+from ..config import Config
 from ..models import ScrapedPage
 from ..formatters import (
     JSONFormatter, CSVFormatter
 )
 
 
+@st.cache_resource
+def _format_executor() -> ThreadPoolExecutor:
+    """One formatting pool for the server, shared by every rerun and session."""
+    return ThreadPoolExecutor(max_workers=Config.DOWNLOAD_FORMAT_WORKERS, thread_name_prefix='format')
+
+
 class DownloadManager:
     """Manages download functionality for different formats."""
     
@@ -21,24 +29,55 @@ class DownloadManager:
             'CSV': CSVFormatter()
         }
     
-    def render_download_section(self, data: Union[ScrapedPage, List[ScrapedPage]]):
+    def prepare_downloads(self, data: Union[ScrapedPage, List[ScrapedPage]]) -> Dict[str, Future]:
+        """Start formatting every download format in the background.
+        
+        Workers only return strings and never touch ``st.*``.
+        """
+        executor = _format_executor()
+        return {
+            format_name: executor.submit(formatter.format, data)
+            for format_name, formatter in self.formatters.items()
+        }
+    
+    def render_download_section(
+        self,
+        data: Union[ScrapedPage, List[ScrapedPage]],
+        prepared: Optional[Dict[str, Future]] = None
+    ):
         """Render download section with all format options."""
         st.markdown("---")
         st.subheader("💾 Download Results")
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if prepared is None:
+            prepared = self.prepare_downloads(data)
         
+        # Poll only when something is still formatting as the section is drawn;
+        # Streamlit keeps a polling fragment ticking until the next full rerun
+        pending = not all(future.done() for future in prepared.values())
+        render_buttons = st.fragment(
+            self._render_download_buttons,
+            run_every=Config.DOWNLOAD_POLL_SECONDS if pending else None
+        )
+        render_buttons(prepared, timestamp)
+    
+    def _render_download_buttons(self, prepared: Dict[str, Future], timestamp: str):
+        """Render a button for each finished format and a placeholder for the rest."""
         # Create columns for download buttons
         cols = st.columns(len(self.formatters))
         
         for i, (format_name, formatter) in enumerate(self.formatters.items()):
             with cols[i]:
-                self._create_download_button(data, formatter, format_name, timestamp)
+                if prepared[format_name].done():
+                    self._create_download_button(prepared[format_name], formatter, format_name, timestamp)
+                else:
+                    st.caption(f"⏳ Preparing {format_name}...")
     
-    def _create_download_button(self, data, formatter, format_name: str, timestamp: str):
+    def _create_download_button(self, formatted: Future, formatter, format_name: str, timestamp: str):
         """Create a single download button."""
         try:
-            formatted_data = formatter.format(data)
+            formatted_data = formatted.result()
             filename = f"scraped_content_{timestamp}.{formatter.get_file_extension()}"
             
             st.download_button(
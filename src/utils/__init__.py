@@ -5,16 +5,23 @@ Utility modules for the web scraper.
 # Import from core.py
 from .core import (
     safe_request,
+    fetch_capped,
+    read_capped_body,
+    ResponseTooLarge,
     delay_request,
+    TTLCache,
     create_progress_callback,
     extract_title_content_pairs,
+    strip_boilerplate,
     extract_custom_data,
+    compile_selector,
     extract_links,
     is_valid_url,
     normalize_url,
     is_internal_link,
     should_skip_url,
-    extract_element_text
+    extract_element_text,
+    write_output_file
 )
 
 # Import from content_categorizer.py
@@ -22,15 +29,22 @@ from .content_categorizer import ContentCategorizer
 
 __all__ = [
     'safe_request',
+    'fetch_capped',
+    'read_capped_body',
+    'ResponseTooLarge',
     'delay_request', 
+    'TTLCache',
     'create_progress_callback',
     'extract_title_content_pairs',
+    'strip_boilerplate',
     'extract_custom_data',
+    'compile_selector',
     'extract_links',
     'is_valid_url',
     'normalize_url',
     'is_internal_link',
     'should_skip_url',
     'extract_element_text',
+    'write_output_file',
     'ContentCategorizer'
 ]
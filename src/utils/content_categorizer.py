@@ -4,13 +4,14 @@ Content categorization utilities using OpenAI.
 
 from typing import Dict, List, Optional
 import json
-from openai import OpenAI
 
 
 class ContentCategorizer:
     """Categorizes scraped content into structured fields using OpenAI."""
     
     def __init__(self, api_key: str):
+        # Imported here so loading src.utils does not pull in the OpenAI SDK
+        from openai import OpenAI
         self.client = OpenAI(api_key=api_key)
     
     def categorize_content(self, title: str, content: str, url: str) -> Dict[str, str]:
@@ -2,15 +2,26 @@
 Core utility functions for the web scraper.
 """
 
+import os
 import re
+import threading
 import time
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
-from typing import Set, List, Optional, Callable
+from typing import Any, Hashable, Set, List, Optional, Callable, Pattern, Union
 from bs4 import BeautifulSoup
 import requests
+import soupsieve
 
 from ..config import Config
 
+HEADING_TAGS = frozenset(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+# Every tag extract_title_content_pairs needs, gathered in a single tree walk
+_TITLE_CONTENT_TAGS = ['title', 'p', *sorted(HEADING_TAGS)]
+
 
 def is_valid_url(url: str) -> bool:
     """Check if URL is valid and accessible."""
@@ -45,8 +56,11 @@ def is_internal_link(url: str, base_domain: str) -> bool:
         return False
 
 
-def should_skip_url(url: str, exclude_patterns: List[str]) -> bool:
+def should_skip_url(url: str, exclude_patterns: Union[Pattern, List[str]]) -> bool:
     """Check if URL should be skipped based on patterns."""
+    if isinstance(exclude_patterns, re.Pattern):
+        return exclude_patterns.search(url) is not None
+    
     for pattern in exclude_patterns:
         if re.search(pattern, url):
             return True
@@ -66,18 +80,35 @@ def extract_links(soup: BeautifulSoup, base_url: str) -> Set[str]:
     return links
 
 
+def strip_boilerplate(soup: BeautifulSoup, tags: List[str] = Config.BOILERPLATE_TAGS) -> BeautifulSoup:
+    """Remove script/style and similar non-content tags from the tree in place."""
+    for element in soup.find_all(tags):
+        element.decompose()
+    return soup
+
+
 def extract_title_content_pairs(soup: BeautifulSoup) -> List[dict]:
     """Extract title-content pairs from HTML content."""
     pairs = []
     
+    # Bucket title, headings and paragraphs in one pass instead of one walk each
+    title_tag = None
+    headings = []
+    paragraphs = []
+    for element in soup.find_all(_TITLE_CONTENT_TAGS):
+        if element.name in HEADING_TAGS:
+            headings.append(element)
+        elif element.name == 'p':
+            paragraphs.append(element)
+        elif title_tag is None:
+            title_tag = element
+    
     # Get main title as first title
-    main_title = soup.title.string.strip() if soup.title else ''
+    main_title = (title_tag.string or '').strip() if title_tag else ''
     if main_title:
         pairs.append({'title': main_title, 'content': ''})
     
     # Find all headings and their following content
-    headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-    
     for heading in headings:
         title = heading.get_text(strip=True)
         if not title:
@@ -89,7 +120,7 @@ def extract_title_content_pairs(soup: BeautifulSoup) -> List[dict]:
         
         while next_element:
             # Stop if we hit another heading
-            if next_element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            if next_element.name in HEADING_TAGS:
                 break
             
             # Extract text from this element
@@ -104,7 +135,6 @@ def extract_title_content_pairs(soup: BeautifulSoup) -> List[dict]:
     
     # If no headings found, get all paragraphs as content with main title
     if not headings and main_title:
-        paragraphs = soup.find_all('p')
         content_parts = []
         for p in paragraphs:
             text = p.get_text(strip=True)
@@ -132,12 +162,18 @@ def extract_element_text(element) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=256)
+def compile_selector(selector: str):
+    """Compile a CSS selector once and reuse it across pages."""
+    return soupsieve.compile(selector)
+
+
 def extract_custom_data(soup: BeautifulSoup, selectors: dict) -> dict:
     """Extract data using custom CSS selectors."""
     data = {}
     
     for key, selector in selectors.items():
-        elements = soup.select(selector)
+        elements = compile_selector(selector).select(soup)
         if elements:
             if len(elements) == 1:
                 data[key] = elements[0].get_text(strip=True)
@@ -156,12 +192,77 @@ def create_progress_callback(progress_bar, status_text) -> Callable:
     return callback
 
 
-def safe_request(url: str, session: requests.Session, timeout: int = Config.TIMEOUT) -> Optional[requests.Response]:
-    """Make a safe HTTP request with error handling."""
+class ResponseTooLarge(requests.exceptions.RequestException):
+    """Raised when a response body grows past the allowed size."""
+
+
+# Cap of the fetch_capped call running on each thread, so code that reads the
+# body earlier (the HTTP cache's filter) enforces the same limit
+_fetch_limits = threading.local()
+
+
+def read_capped_body(response: requests.Response, max_bytes: Optional[int] = None) -> bytes:
+    """Read a streamed body into ``response.content``, stopping past ``max_bytes``.
+    
+    ``max_bytes`` defaults to the cap of the current ``fetch_capped`` call.
+    Oversized bodies close the response and raise ``ResponseTooLarge`` before
+    they are buffered in full.
+    """
+    if max_bytes is None:
+        max_bytes = getattr(_fetch_limits, 'max_bytes', Config.MAX_RESPONSE_BYTES)
+    
+    declared_length = response.headers.get('Content-Length')
+    if declared_length and declared_length.isdigit() and int(declared_length) > max_bytes:
+        response.close()
+        raise ResponseTooLarge(f"{response.url} is {declared_length} bytes, over the {max_bytes} byte limit")
+    
+    chunks = []
+    received = 0
+    for chunk in response.iter_content(chunk_size=Config.STREAM_CHUNK_SIZE):
+        received += len(chunk)
+        if received > max_bytes:
+            response.close()
+            raise ResponseTooLarge(f"{response.url} is over the {max_bytes} byte limit")
+        chunks.append(chunk)
+    
+    # Hand the capped body back through the usual response.content API
+    response._content = b''.join(chunks)
+    return response._content
+
+
+def fetch_capped(
+    url: str,
+    session: requests.Session,
+    timeout: int = Config.TIMEOUT,
+    max_bytes: int = Config.MAX_RESPONSE_BYTES
+) -> requests.Response:
+    """GET ``url``, streaming the body and raising once it grows past ``max_bytes``.
+    
+    Oversized pages are never buffered in full; they raise ``ResponseTooLarge``,
+    and other failures raise the usual ``requests`` exceptions.
+    """
+    _fetch_limits.max_bytes = max_bytes
     try:
-        response = session.get(url, timeout=timeout)
-        response.raise_for_status()
-        return response
+        with session.get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            read_capped_body(response, max_bytes)
+            return response
+    finally:
+        del _fetch_limits.max_bytes
+
+
+def safe_request(
+    url: str,
+    session: requests.Session,
+    timeout: int = Config.TIMEOUT,
+    max_bytes: int = Config.MAX_RESPONSE_BYTES
+) -> Optional[requests.Response]:
+    """Make a safe HTTP request with error handling.
+    
+    Returns None on any failure, including a body larger than ``max_bytes``.
+    """
+    try:
+        return fetch_capped(url, session, timeout, max_bytes)
     except requests.exceptions.RequestException:
         return None
 
@@ -170,3 +271,61 @@ def delay_request(delay: float = Config.DEFAULT_DELAY):
     """Add delay between requests to be respectful."""
     if delay > 0:
         time.sleep(delay)
+
+
+class TTLCache:
+    """Thread-safe cache whose entries expire after ``ttl`` seconds.
+    
+    At most ``max_entries`` are kept; the least recently used goes first.
+    """
+    
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for ``key``, or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            
+            value, stored_at = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                return default
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entries past the limit."""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def write_output_file(path: str, content: str, buffer_size: int = 1 << 20) -> str:
+    """Write exported content to disk atomically.
+    
+    The text is encoded once and written through a large buffer to a temporary
+    file in the target directory, which then replaces ``path`` in one step so a
+    failed export never leaves a truncated file behind.
+    """
+    path = os.path.abspath(path)
+    tmp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+    # Created with mode 0o666 so the kernel applies the umask exactly as a plain
+    # open() would; O_EXCL keeps the unique name from clobbering anything
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with os.fdopen(fd, 'wb', buffering=buffer_size) as f:
+            f.write(content.encode('utf-8'))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path